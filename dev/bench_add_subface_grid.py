@@ -0,0 +1,117 @@
+"""Benchmark the sub-face search of the HB Add Subface component.
+
+The sub_face_grid and candidate_sub_faces functions are loaded from the
+component source so that the benchmark always measures the code that ships.
+Each parent Face is matched to the sub-faces with an overlapping bounding box,
+which is compared against a brute-force check of every sub-face for every
+Face on a facade of walls with several apertures each. This requires the
+honeybee-core library to be installed in the Python environment.
+
+Usage:
+    python dev/bench_add_subface_grid.py [face counts...]
+"""
+import os
+import sys
+import time
+
+from ladybug_geometry.geometry3d import Point3D, Face3D
+from ladybug_geometry.bounding import overlapping_bounding_boxes
+from honeybee.face import Face
+from honeybee.aperture import Aperture
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from honeybee_grasshopper_core import spatial  # noqa: E402
+
+COMPONENT = os.path.join(
+    ROOT, 'honeybee_grasshopper_core', 'src', 'HB Add Subface.py')
+TOLERANCE = 0.01
+APERTURES_PER_FACE = 5
+MAX_BRUTE_FORCE = 20000000  # the largest number of face/sub-face pairs to check
+
+
+def load_functions(names):
+    """Load top-level functions from the component without running it.
+
+    The component is written for IronPython 2.7 and cannot be parsed as a whole
+    by Python 3. So the source of each function is taken from its def line up
+    to the next line without indentation. The functions are run with the shared
+    spatial module functions that the component imports.
+    """
+    with open(COMPONENT) as f:
+        lines = f.read().splitlines()
+    blocks, current = [], None
+    for line in lines:
+        if line.startswith('def '):
+            current = [line] if line[4:].split('(')[0] in names else None
+            if current is not None:
+                blocks.append(current)
+        elif current is not None and (line == '' or line[0] in ' \t'):
+            current.append(line)
+        else:
+            current = None
+    namespace = dict(vars(spatial))
+    namespace['tolerance'] = TOLERANCE
+    code = '\n'.join(line for block in blocks for line in block)
+    exec(compile(code, COMPONENT, 'exec'), namespace)
+    return namespace
+
+
+def facade(face_count, per_face=APERTURES_PER_FACE, width=4.0, height=3.0):
+    """Get a square facade of wall Faces and the Apertures to be added to them."""
+    columns = int(face_count ** 0.5)
+    faces, sub_faces = [], []
+    ap_width = width / per_face
+    for k in range(face_count):
+        x, z = (k % columns) * width, int(k / columns) * height
+        faces.append(Face('Wall_{}'.format(k), Face3D(
+            [Point3D(x, 0, z), Point3D(x + width, 0, z),
+             Point3D(x + width, 0, z + height), Point3D(x, 0, z + height)])))
+        for a in range(per_face):
+            x_1, x_2 = x + a * ap_width + 0.05, x + (a + 1) * ap_width - 0.05
+            sub_faces.append(Aperture('Window_{}_{}'.format(k, a), Face3D(
+                [Point3D(x_1, 0, z + 0.5), Point3D(x_2, 0, z + 0.5),
+                 Point3D(x_2, 0, z + 2.5), Point3D(x_1, 0, z + 2.5)])))
+    return faces, sub_faces
+
+
+def brute_force_matches(faces, sub_faces):
+    """Get the sub-faces that overlap each Face by checking all sub-faces."""
+    return [[i for i, sf in enumerate(sub_faces)
+             if overlapping_bounding_boxes(face.geometry, sf.geometry, TOLERANCE)]
+            for face in faces]
+
+
+def grid_matches(faces, sub_faces, functions):
+    """Get the sub-faces that overlap each Face using the component's grid."""
+    sf_grid = functions['sub_face_grid'](sub_faces, TOLERANCE)
+    return [[i for i in functions['candidate_sub_faces'](face, sf_grid)
+             if overlapping_bounding_boxes(
+                 face.geometry, sub_faces[i].geometry, TOLERANCE)]
+            for face in faces]
+
+
+def time_function(func, *args):
+    start = time.time()
+    result = func(*args)
+    return result, time.time() - start
+
+
+if __name__ == '__main__':
+    counts = [int(c) for c in sys.argv[1:]] or [400, 1600, 10000]
+    functions = load_functions(('sub_face_grid', 'candidate_sub_faces'))
+    print('{:>8} {:>10} {:>12} {:>14}'.format(
+        'faces', 'sub-faces', 'grid (s)', 'all pairs (s)'))
+    for count in counts:
+        faces, sub_faces = facade(count)
+        result, grid_time = time_function(grid_matches, faces, sub_faces, functions)
+        assert all(len(m) == APERTURES_PER_FACE for m in result), \
+            'Not all sub-faces were matched to their parent Face.'
+        if len(faces) * len(sub_faces) <= MAX_BRUTE_FORCE:
+            expected, bf_time = time_function(brute_force_matches, faces, sub_faces)
+            assert result == expected, 'Grid matches do not match all pairs.'
+            bf_time = '{:.3f}'.format(bf_time)
+        else:
+            bf_time = 'skipped'
+        print('{:>8} {:>10} {:>12.3f} {:>14}'.format(
+            len(faces), len(sub_faces), grid_time, bf_time))
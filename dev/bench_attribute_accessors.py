@@ -0,0 +1,92 @@
+"""Benchmark the attribute evaluation of the HB Faces by Attribute component.
+
+The attributes of a model of Rooms are evaluated with the functions of the
+honeybee_grasshopper_core.attribute module, which is compared against the
+honeybee ColorFace and ColorRoom objects that the components used before.
+The results are checked to be identical to those of the color objects so
+this also tests the attribute module against the installed version of
+honeybee-core, which must be installed in the Python environment.
+
+Usage:
+    python dev/bench_attribute_accessors.py [room counts...]
+"""
+import os
+import sys
+import time
+
+from ladybug_geometry.geometry3d import Point3D
+from honeybee.room import Room
+from honeybee.colorobj import ColorFace, ColorRoom
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from honeybee_grasshopper_core.attribute import attribute_values, \
+    display_attributes, flatten_faces  # noqa: E402
+
+ATTRIBUTES = (
+    'display_name', 'type', 'boundary_condition', 'area', 'user_data.zone',
+    'geometry.is_convex', '__class__.__name__', 'nonexistent'
+)
+
+
+def rooms_grid(room_count, size=4.0, height=3.0):
+    """Get a square grid of box Rooms with an Aperture on each wall."""
+    columns = int(room_count ** 0.5) or 1
+    rooms = []
+    for k in range(room_count):
+        origin = Point3D((k % columns) * size, int(k / columns) * size, 0)
+        room = Room.from_box('Room_{}'.format(k), size, size, height, origin=origin)
+        room.user_data = {'zone': 'Zone_{}'.format(k % 7)} if k % 3 else None
+        for face in room.faces[1:5]:
+            face.apertures_by_ratio(0.4)
+        rooms.append(room)
+    return rooms
+
+
+def color_object_attributes(color_class, objs, attr_name):
+    """Get the attributes of objects from a honeybee color object."""
+    try:
+        color_obj = color_class(objs, attr_name)
+    except IndexError:  # attribute names that the color objects cannot title
+        return None
+    objs = color_obj.flat_faces if color_class is ColorFace else color_obj.rooms
+    return list(objs), color_obj.attributes, color_obj.attributes_unique
+
+
+def module_attributes(color_class, objs, attr_name):
+    """Get the attributes of objects with the attribute module functions."""
+    if color_class is ColorFace:
+        objs = flatten_faces(objs)
+    attributes, attributes_unique = display_attributes(attribute_values(objs, attr_name))
+    return list(objs), attributes, attributes_unique
+
+
+def time_function(func, *args):
+    start = time.time()
+    result = func(*args)
+    return result, time.time() - start
+
+
+if __name__ == '__main__':
+    counts = [int(c) for c in sys.argv[1:]] or [100, 1000]
+    print('{:>8} {:>8} {:>26} {:>14} {:>12}'.format(
+        'objects', 'class', 'attribute', 'color obj (s)', 'module (s)'))
+    for count in counts:
+        rooms = rooms_grid(count)
+        faces = [face for room in rooms for face in room.faces]
+        for face in faces:  # punch the faces once so that only attributes are timed
+            face.punched_geometry
+        for color_class, objs in ((ColorFace, faces), (ColorRoom, rooms)):
+            for attr_name in ATTRIBUTES:
+                expected, c_time = time_function(
+                    color_object_attributes, color_class, objs, attr_name)
+                result, m_time = time_function(
+                    module_attributes, color_class, objs, attr_name)
+                if expected is not None:
+                    assert result == expected, 'Attributes of {} do not match ' \
+                        '{}.'.format(attr_name, color_class.__name__)
+                    c_time = '{:.3f}'.format(c_time)
+                else:
+                    c_time = 'failed'
+                print('{:>8} {:>8} {:>26} {:>14} {:>12.3f}'.format(
+                    len(result[0]), color_class.__name__, attr_name, c_time, m_time))
@@ -0,0 +1,91 @@
+"""Benchmark the neighbor search of the HB Intersect Solids component.
+
+The neighbor_indices function is loaded from the component source so that
+the benchmark always measures the code that ships. It is compared against a
+brute-force check of all pairs on floor plates of box rooms that are laid out
+along the X axis and along the Y axis, which should take about the same time.
+
+Usage:
+    python dev/bench_intersect_neighbors.py [room counts...]
+"""
+import ast
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from honeybee_grasshopper_core import spatial  # noqa: E402
+
+COMPONENT = os.path.join(
+    ROOT, 'honeybee_grasshopper_core', 'src', 'HB Intersect Solids.py')
+TOLERANCE = 0.01
+
+
+def load_functions(names):
+    """Load top-level functions from the component without running it.
+
+    The functions are run with the shared spatial module functions that the
+    component imports from honeybee_grasshopper_core.
+    """
+    with open(COMPONENT) as f:
+        tree = ast.parse(f.read())
+    module = ast.Module(
+        body=[node for node in tree.body
+              if isinstance(node, ast.FunctionDef) and node.name in names],
+        type_ignores=[])
+    namespace = dict(vars(spatial))
+    exec(compile(module, COMPONENT, 'exec'), namespace)
+    return namespace
+
+
+def brute_force_neighbors(b_boxes, tolerance):
+    """Get the neighbors of each bounding box by checking all pairs."""
+    neighbors = [[] for _ in b_boxes]
+    for i, (min_1, max_1) in enumerate(b_boxes):
+        for j in range(i + 1, len(b_boxes)):
+            min_2, max_2 = b_boxes[j]
+            if all(mn_1 <= mx_2 + tolerance and mn_2 <= mx_1 + tolerance
+                   for mn_1, mx_1, mn_2, mx_2 in zip(min_1, max_1, min_2, max_2)):
+                neighbors[i].append(j)
+                neighbors[j].append(i)
+    return tuple(tuple(nbrs) for nbrs in neighbors)
+
+
+def floor_plate(room_count, along_y=False, depth=3, size=5.0, floors=3):
+    """Get bounding boxes for a long floor plate of box rooms."""
+    per_floor = int(room_count / floors)
+    length = int(per_floor / depth)
+    b_boxes = []
+    for k in range(floors):
+        for i in range(length):
+            for j in range(depth):
+                x, y = (j, i) if along_y else (i, j)
+                b_boxes.append((
+                    (x * size, y * size, k * size),
+                    ((x + 1) * size, (y + 1) * size, (k + 1) * size)))
+    return b_boxes
+
+
+def time_function(func, b_boxes):
+    start = time.time()
+    result = func(b_boxes, TOLERANCE)
+    return result, time.time() - start
+
+
+if __name__ == '__main__':
+    counts = [int(c) for c in sys.argv[1:]] or [900, 3600, 14400]
+    neighbor_indices = load_functions(('neighbor_indices',))['neighbor_indices']
+    print('{:>8} {:>6} {:>12} {:>12}'.format('rooms', 'axis', 'grid (s)', 'all pairs (s)'))
+    for count in counts:
+        for along_y in (False, True):
+            b_boxes = floor_plate(count, along_y)
+            result, grid_time = time_function(neighbor_indices, b_boxes)
+            if len(b_boxes) <= 5000:
+                expected, bf_time = time_function(brute_force_neighbors, b_boxes)
+                assert result == expected, 'Grid neighbors do not match all pairs.'
+                bf_time = '{:.3f}'.format(bf_time)
+            else:
+                bf_time = 'skipped'
+            print('{:>8} {:>6} {:>12.3f} {:>12}'.format(
+                len(b_boxes), 'Y' if along_y else 'X', grid_time, bf_time))
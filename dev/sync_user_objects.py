@@ -0,0 +1,343 @@
+"""Regenerate the Grasshopper user objects from the component source and json.
+
+The .ghuser files are binary GH_IO archives that are normally exported from
+Grasshopper. This script rewrites the parts of them that come from this
+repository so that they can be kept in sync with src/ and json/ without
+opening Rhino. The code of each user object is set from src/ while the
+descriptions and the input parameters are set from json/. Inputs that do
+not yet exist in the user object are added with the type hint and access
+of the json and the placement of the input above them. All other data
+(icons, GUIDs of existing parameters, editor settings) is left untouched.
+
+Usage:
+    python dev/sync_user_objects.py [--check] [component names...]
+
+With --check, nothing is written and the script exits with a non-zero code
+if any user object is out of sync with the source.
+"""
+import io
+import json
+import os
+import struct
+import sys
+import uuid
+import zlib
+
+PACKAGE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'honeybee_grasshopper_core')
+SRC, JSON, USER_OBJECTS = (os.path.join(PACKAGE, folder)
+                           for folder in ('src', 'json', 'user_objects'))
+
+# sizes in bytes of the fixed-size GH_IO item types
+ITEM_SIZES = {1: 1, 2: 1, 3: 4, 4: 8, 5: 4, 6: 8, 7: 16, 8: 8, 9: 16, 30: 8,
+              31: 8, 32: 8, 33: 8, 34: 16, 35: 16, 36: 4, 50: 16, 51: 24,
+              52: 32, 53: 16, 54: 32, 55: 48, 56: 48, 57: 72, 58: 12}
+STRING, BYTES, DOUBLES, BITMAP = 10, 20, 21, 37
+# type hints of the GhPython script parameters keyed by the json type
+TYPE_HINTS = {
+    'System.Object': '35915213-5534-4277-81b8-1bdc9e7383d2',
+    'bool': 'd60527f5-b5af-4ef6-8970-5f96fe412559',
+    'int': '48d01794-d3d8-4aef-990e-127168822244',
+    'double': '39fbc626-7a01-46ab-a18e-ec1c0c41685b',
+    'string': '37261734-eec7-4f50-b6a8-b8d1f3c4396b',
+    'Point3d': 'e1937b56-b1da-4c12-8bd8-e34ee81746ef',
+    'Vector3d': '15a50725-e3d3-4075-9f7c-142ba5f40747',
+    'Plane': '3897522d-58e9-4d60-b38c-978ddacfedd8',
+    'Brep': '2ceb0405-fdfe-403d-a4d6-8786da45fb9d',
+    'GeometryBase': 'c37956f4-d39c-49c7-af71-1e87f8031b26'
+}
+PARAM_HEIGHT = 20  # height of each parameter on the component in Grasshopper
+
+
+class Item(object):
+    """A named value of a GH_IO chunk."""
+
+    def __init__(self, name, index, type_id, value):
+        self.name, self.index, self.type_id, self.value = \
+            name, index, type_id, value
+
+
+class Chunk(object):
+    """A named GH_IO chunk with items and nested chunks."""
+
+    def __init__(self, name, index=-1, items=None, chunks=None):
+        self.name, self.index = name, index
+        self.items = items or []
+        self.chunks = chunks or []
+
+    def item(self, name, index=-1):
+        for itm in self.items:
+            if itm.name == name and itm.index == index:
+                return itm
+
+    def chunk(self, name, index=-1):
+        for chk in self.chunks:
+            if chk.name == name and chk.index == index:
+                return chk
+
+    def set_string(self, name, text):
+        self.item(name).value = text
+
+    def copy(self):
+        return Chunk(self.name, self.index,
+                     [Item(i.name, i.index, i.type_id, i.value) for i in self.items],
+                     [c.copy() for c in self.chunks])
+
+
+def _read_string(stream):
+    length = shift = 0
+    while True:
+        byte = ord(stream.read(1))
+        length |= (byte & 0x7f) << shift
+        shift += 7
+        if byte < 128:
+            break
+    return stream.read(length).decode('utf-8')
+
+
+def _write_string(stream, text):
+    data = text.encode('utf-8')
+    length = len(data)
+    while True:
+        byte, length = length & 0x7f, length >> 7
+        stream.write(struct.pack('B', byte | 0x80 if length else byte))
+        if not length:
+            break
+    stream.write(data)
+
+
+def _read_int(stream):
+    return struct.unpack('<i', stream.read(4))[0]
+
+
+def read_chunk(stream):
+    """Read a GH_IO chunk from a binary stream."""
+    chunk = Chunk(_read_string(stream), _read_int(stream))
+    item_count, chunk_count = _read_int(stream), _read_int(stream)
+    for _ in range(item_count):
+        name, index, type_id = \
+            _read_string(stream), _read_int(stream), _read_int(stream)
+        if type_id == STRING:
+            value = _read_string(stream)
+        elif type_id in (BYTES, BITMAP):
+            value = stream.read(_read_int(stream))
+        elif type_id == DOUBLES:
+            value = stream.read(8 * _read_int(stream))
+        else:
+            value = stream.read(ITEM_SIZES[type_id])
+        chunk.items.append(Item(name, index, type_id, value))
+    for _ in range(chunk_count):
+        chunk.chunks.append(read_chunk(stream))
+    return chunk
+
+
+def write_chunk(stream, chunk):
+    """Write a GH_IO chunk to a binary stream."""
+    _write_string(stream, chunk.name)
+    stream.write(struct.pack('<iii', chunk.index, len(chunk.items), len(chunk.chunks)))
+    for itm in chunk.items:
+        _write_string(stream, itm.name)
+        stream.write(struct.pack('<ii', itm.index, itm.type_id))
+        if itm.type_id == STRING:
+            _write_string(stream, itm.value)
+        elif itm.type_id in (BYTES, BITMAP):
+            stream.write(struct.pack('<i', len(itm.value)))
+            stream.write(itm.value)
+        elif itm.type_id == DOUBLES:
+            stream.write(struct.pack('<i', len(itm.value) // 8))
+            stream.write(itm.value)
+        else:
+            stream.write(itm.value)
+    for chk in chunk.chunks:
+        write_chunk(stream, chk)
+
+
+def load_archive(data):
+    """Load a GH_IO chunk from deflated archive bytes."""
+    decompress = zlib.decompressobj(-zlib.MAX_WBITS)
+    return read_chunk(io.BytesIO(decompress.decompress(data) + decompress.flush()))
+
+
+def serialize(chunk):
+    """Get the uncompressed archive bytes of a GH_IO chunk."""
+    stream = io.BytesIO()
+    write_chunk(stream, chunk)
+    return stream.getvalue()
+
+
+def dump_archive(chunk):
+    """Get deflated archive bytes for a GH_IO chunk."""
+    compress = zlib.compressobj(9, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compress.compress(serialize(chunk)) + compress.flush()
+
+
+def crlf(text):
+    """Convert the line endings of text to those used by Grasshopper."""
+    return text.replace('\r\n', '\n').replace('\n', '\r\n')
+
+
+def code_text(src, old_code):
+    """Get the code of a user object from the source of the component.
+
+    Lines that are stamped by the release process (eg. the version and the
+    copyright) are stored with bare line feeds in the user objects. These
+    are kept as they are such that an unchanged component round-trips.
+    """
+    bare_lines = set()
+    for segment in old_code.split('\r\n'):
+        bare_lines.update(segment.split('\n')[:-1])
+    lines = src.replace('\r\n', '\n').split('\n')
+    code = []
+    for line in lines[:-1]:
+        code.append(line + ('\n' if line in bare_lines else '\r\n'))
+    code.append(lines[-1])
+    return ''.join(code)
+
+
+def _shift(attributes, y):
+    """Shift the Bounds and Pivot of a parameter Attributes chunk along Y."""
+    bounds, pivot = attributes.item('Bounds'), attributes.item('Pivot')
+    b = list(struct.unpack('<4f', bounds.value))
+    p = list(struct.unpack('<2f', pivot.value))
+    b[1] += y
+    p[1] += y
+    bounds.value, pivot.value = struct.pack('<4f', *b), struct.pack('<2f', *p)
+
+
+def input_template(param, templates):
+    """Get a new input parameter chunk for a json input."""
+    key = (param['type'], param['access'])
+    if key not in templates:
+        raise ValueError('No user object has an input of type {} with {} '
+                         'access to use as a template.'.format(*key))
+    return templates[key].copy()
+
+
+def sync_inputs(data, inputs, templates, name):
+    """Sync the input parameters of a ParameterData chunk with json inputs."""
+    old = [c for c in data.chunks if c.name == 'InputParam']
+    existing = {c.item('Name').value: c for c in old}
+    new_params = []
+    for i, param in enumerate(inputs):
+        try:
+            chunk = existing[param['name']]
+        except KeyError:  # new input; build it from a template
+            chunk = input_template(param, templates)
+            guid = uuid.uuid5(uuid.NAMESPACE_URL, '{}/{}'.format(name, param['name']))
+            chunk.item('InstanceGuid').value = guid.bytes_le
+            chunk.set_string('Name', param['name'])
+            chunk.set_string('NickName', param['name'])
+            if len(new_params) != 0:  # place the input below the previous one
+                attributes = new_params[-1].chunk('Attributes').copy()
+                _shift(attributes, PARAM_HEIGHT)
+                chunk.chunks = [attributes]
+        chunk.set_string('Description', crlf(param['description']))
+        chunk.index = i
+        new_params.append(chunk)
+    added = len(new_params) - len(old)
+    others = [c for c in data.chunks if c.name != 'InputParam']
+    data.chunks = new_params + others
+    # update the count and the list of parameter types
+    data.item('InputCount').value = struct.pack('<i', len(new_params))
+    input_id = data.item('InputId', 0)
+    rest = [itm for itm in data.items if itm.name != 'InputId']
+    ids = [Item('InputId', i, input_id.type_id, input_id.value)
+           for i in range(len(new_params))]
+    at = rest.index(data.item('InputCount')) + 1
+    data.items = rest[:at] + ids + rest[at:]
+    return added
+
+
+def sync_outputs(data, outputs):
+    """Sync the descriptions of the output parameters with json outputs."""
+    descriptions = {param['name']: param['description'] for param in outputs}
+    for chunk in data.chunks:
+        if chunk.name == 'OutputParam':
+            out_name = chunk.item('Name').value
+            if out_name in descriptions:
+                chunk.set_string('Description', crlf(descriptions[out_name]))
+
+
+def grow_component(inner, added):
+    """Grow the height of a component for each input that was added to it."""
+    if added <= 0:
+        return
+    bounds = inner.chunk('Attributes').item('Bounds')
+    b = list(struct.unpack('<4f', bounds.value))
+    b[3] += added * PARAM_HEIGHT
+    bounds.value = struct.pack('<4f', *b)
+
+
+def collect_templates(names):
+    """Collect an input parameter of each type and access from the user objects."""
+    templates = {}
+    for name in names:
+        comp = json.load(open(os.path.join(JSON, name.replace(' ', '_') + '.json')))
+        with open(os.path.join(USER_OBJECTS, name + '.ghuser'), 'rb') as f:
+            outer = load_archive(f.read())
+        inner = load_archive(outer.item('Object').value)
+        params = {c.item('Name').value: c for c in inner.chunk('ParameterData').chunks
+                  if c.name == 'InputParam'}
+        for param in comp['inputs']:
+            chunk = params.get(param['name'])
+            if chunk is None or chunk.item('Mapping') is not None:
+                continue
+            hint = chunk.item('TypeHintID')
+            if hint is None or str(uuid.UUID(bytes_le=hint.value)) != \
+                    TYPE_HINTS.get(param['type']):
+                continue
+            templates.setdefault((param['type'], param['access']), chunk)
+    return templates
+
+
+def sync_user_object(name, templates):
+    """Get the synced archive of a user object and whether it has changed."""
+    path = os.path.join(USER_OBJECTS, name + '.ghuser')
+    comp = json.load(open(os.path.join(JSON, name.replace(' ', '_') + '.json')))
+    with open(os.path.join(SRC, name + '.py')) as f:
+        src = f.read()
+    with open(path, 'rb') as f:
+        original = f.read()
+    outer = load_archive(original)
+    inner = load_archive(outer.item('Object').value)
+    before = serialize(outer), serialize(inner)
+
+    description = crlf(comp['description'])
+    outer.set_string('Description', description)
+    inner.set_string('Description', description)
+    inner.set_string('CodeInput', code_text(src, inner.item('CodeInput').value))
+    data = inner.chunk('ParameterData')
+    added = sync_inputs(data, comp['inputs'], templates, name)
+    sync_outputs(data, comp['outputs'][0])
+    grow_component(inner, added)
+
+    if (serialize(outer), serialize(inner)) == before:
+        return path, original, False
+    outer.item('Object').value = dump_archive(inner)
+    return path, dump_archive(outer), True
+
+
+def main(args):
+    """Sync the user objects of the components named in args or all components."""
+    check = '--check' in args
+    names = [arg for arg in args if arg != '--check']
+    all_names = sorted(f[:-7] for f in os.listdir(USER_OBJECTS) if f.endswith('.ghuser')
+                       and os.path.isfile(os.path.join(SRC, f[:-7] + '.py')))
+    templates = collect_templates(all_names)
+    out_of_sync = []
+    for name in names or all_names:
+        path, data, changed = sync_user_object(name, templates)
+        if not changed:
+            continue
+        out_of_sync.append(name)
+        if not check:
+            with open(path, 'wb') as f:
+                f.write(data)
+    for name in out_of_sync:
+        print('{} {}'.format('out of sync:' if check else 'updated:', name))
+    return 1 if check and out_of_sync else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
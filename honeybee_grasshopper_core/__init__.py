@@ -1,7 +1,8 @@
 """Honeybee Grasshopper Core Plugin.
 
-Note that this package is not intended to run with cPython and it only possesses
-the Grasshopper components. In order to run the plugin, the core libraries must
-be installed in a manner that they can be discovered by Rhino.
+Note that this package is not intended to run with cPython. It possesses the
+Grasshopper components along with a few modules of helper functions that are
+shared between the components. In order to run the plugin, the core libraries
+must be installed in a manner that they can be discovered by Rhino.
 The package includes both the userobjects (.ghuser) and the Python source (.py).
 """
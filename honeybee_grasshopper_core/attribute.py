@@ -0,0 +1,211 @@
+"""Functions shared by the components that evaluate the attributes of honeybee objects.
+
+The attribute accessors in this module are compiled once and shared by all of
+the components that import it such that the text of an attribute only needs
+to be parsed the first time that it is requested.
+"""
+from operator import attrgetter
+
+from honeybee.face import Face
+from honeybee.aperture import Aperture
+from honeybee.door import Door
+from honeybee.shade import Shade
+from honeybee.shademesh import ShadeMesh
+
+# dictionary of unit-sensitive properties to be handled specially
+UNIT_SENSITIVE = {
+    'properties.energy.r_factor': 'R Factor',
+    'properties.energy.u_factor': 'U Factor',
+    'properties.energy.shgc': 'SHGC'
+}
+_accessors = {}  # compiled attribute accessors keyed by the attribute text
+
+
+def attribute_accessor(attr_name):
+    """Get a compiled function that gets a nested attribute from an object.
+
+    The attribute path is only parsed the first time that it is requested and
+    the resulting function is cached such that all objects can be evaluated
+    without any further processing of the attribute text.
+
+    Args:
+        attr_name: Text for an attribute with '.' separating nested attributes.
+            For example, 'properties.energy.construction.display_name'.
+
+    Returns:
+        A function that takes an object and returns the attribute of the object
+        without calling it. AttributeError will be raised if the attribute is
+        not valid for the object or an object along the path is None.
+    """
+    try:
+        return _accessors[attr_name]
+    except KeyError:  # the attribute has not been compiled yet
+        pass
+    if '.' not in attr_name:  # honeybee-core attribute
+        accessor = attrgetter(attr_name)
+    else:  # nested attribute; compile a chain of getters
+        getters = tuple((attribute, attrgetter(attribute))
+                        for attribute in attr_name.split('.'))
+
+        def accessor(obj):
+            for attribute, getter in getters:
+                if obj is None:
+                    raise AttributeError
+                obj = obj.get(attribute, None) if isinstance(obj, dict) else getter(obj)
+            return obj
+
+    _accessors[attr_name] = accessor
+    return accessor
+
+
+def attribute_values(hb_objs, attr_name):
+    """Get the values of an attribute for a list of honeybee objects in bulk.
+
+    The values are the same as those of get_attr_nested with cast_to_str=False.
+    So callable attributes are called and 'N/A' is returned for objects that
+    do not have the attribute.
+
+    Args:
+        hb_objs: A list of honeybee objects.
+        attr_name: Text for an attribute with '.' separating nested attributes.
+
+    Returns:
+        A list with the value of the attribute for each object.
+    """
+    accessor = attribute_accessor(attr_name)
+    nested = '.' in attr_name
+    values = []
+    for obj in hb_objs:
+        try:
+            val = accessor(obj)
+            values.append(val() if callable(val) else val)
+        except AttributeError as e:
+            values.append('None' if nested and 'NoneType' in str(e) else 'N/A')
+    return values
+
+
+def rounded_value(val, decimal_count):
+    """Round a float attribute value or cast any other value to text."""
+    if isinstance(val, float):
+        if decimal_count:
+            return round(val, decimal_count)
+        elif decimal_count == 0:
+            return int(val)
+        return val
+    return str(val)
+
+
+def thermal_key(hb_obj):
+    """Get a key for the properties that determine the thermal values of an object.
+
+    This includes the construction of the object along with the height and
+    altitude of its geometry, which are used to compute the air film resistances.
+    The area, perimeter and vertex count are also included for Apertures and
+    Doors since they are used to account for any window frames.
+    """
+    geo = hb_obj.geometry
+    key = (hb_obj.__class__.__name__, hb_obj.properties.energy.construction.identifier,
+           geo.max.z - geo.min.z, hb_obj.altitude)
+    if not isinstance(hb_obj, Face):
+        key += (geo.area, geo.perimeter, len(geo.vertices))
+    return key
+
+
+def unit_sensitive_values(hb_objs, attr_name, units):
+    """Get the values of a unit-sensitive attribute for honeybee objects in bulk.
+
+    Objects are grouped by their thermal_key such that the attribute is only
+    computed once for all objects that share a construction and the geometric
+    properties of the calculation. The value is then assigned to all objects
+    of the group.
+
+    Args:
+        hb_objs: A list of honeybee objects.
+        attr_name: Text for one of the UNIT_SENSITIVE attributes.
+        units: Text for the units system of the object geometry.
+
+    Returns:
+        A list with the value of the attribute for each object. 'N/A' is
+        returned for objects that do not have the attribute (eg. Shades).
+    """
+    get_energy = attribute_accessor(attr_name.rsplit('.', 1)[0])
+    method_name = attr_name.split('.')[-1]
+    group_values, values = {}, []
+    for obj in hb_objs:
+        try:
+            obj_method = getattr(get_energy(obj), method_name)
+        except AttributeError:  # shade geometry
+            values.append('N/A')
+            continue
+        key = thermal_key(obj)
+        try:
+            val = group_values[key]
+        except KeyError:  # first object of the group
+            val = group_values[key] = obj_method(units)
+        values.append(val)
+    return values
+
+
+
+def display_attributes(values, decimal_count=2):
+    """Get the display text of attribute values along with the unique display text.
+
+    The text is the same as the attributes and attributes_unique of the honeybee
+    ColorFace and ColorRoom objects, which can be used to group objects by their
+    attributes without building a color object.
+
+    Args:
+        values: A list of attribute values, typically from attribute_values.
+        decimal_count: An integer for the number of decimal places to which
+            float values are rounded. (Default: 2, which is the same as the
+            default legend parameters of the color objects).
+
+    Returns:
+        A tuple with two items.
+
+        -   attributes: A tuple with the display text of each value.
+
+        -   attributes_unique: A tuple with the unique display text, where the
+            text values are sorted before the sorted number values.
+    """
+    attributes = [rounded_value(val, decimal_count) for val in values]
+    attributes_unique = set(attributes)
+    float_attr = [atr for atr in attributes_unique if isinstance(atr, float)]
+    str_attr = [atr for atr in attributes_unique if isinstance(atr, str)]
+    float_attr.sort()
+    str_attr.sort()
+    return tuple(str(val) for val in attributes), \
+        tuple(str_attr) + tuple(str(val) for val in float_attr)
+
+
+def flatten_faces(faces):
+    """Get a list of Faces with their sub-faces and shades in the order of ColorFace.
+
+    Args:
+        faces: A list of honeybee Faces, Apertures, Doors, Shades and/or ShadeMeshes.
+
+    Returns:
+        A list with each Face followed by its Shades, Apertures and Doors, where
+        each Aperture and Door is followed by its own Shades.
+    """
+    flat_f = []
+    for face in faces:
+        if isinstance(face, Face):
+            flat_f.append(face)
+            flat_f.extend(face.shades)
+            for ap in face.apertures:
+                flat_f.append(ap)
+                flat_f.extend(ap.shades)
+            for dr in face.doors:
+                flat_f.append(dr)
+                flat_f.extend(dr.shades)
+        elif isinstance(face, (Aperture, Door)):
+            flat_f.append(face)
+            flat_f.extend(face.shades)
+        elif isinstance(face, (Shade, ShadeMesh)):
+            flat_f.append(face)
+        else:
+            raise ValueError(
+                'Expected honeybee Face, Aperture, Door, Shade or ShadeMesh. '
+                'Got {}.'.format(type(face)))
+    return flat_f
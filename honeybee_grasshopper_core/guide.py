@@ -0,0 +1,98 @@
+"""Functions for selecting the Faces of Rooms that are coplanar with a guide surface.
+
+The spatial index of each guide surface and the Faces that are selected in
+each Room are cached in this module so that they are shared by all of the
+components that use the same guide surface. So changing the other inputs of
+a component only requires the cached selections to be looked up for each Room.
+Each cache only keeps a fixed number of the most recently used results.
+"""
+from collections import OrderedDict
+
+from ladybug_geometry.bounding import overlapping_bounding_boxes
+
+from .spatial import median_cell_size, bounding_box_grid, grid_candidates
+
+GUIDE_CACHE_SIZE = 10
+_guide_cache = OrderedDict()  # guide indices keyed by guide geometry and tolerance
+SELECTION_CACHE_SIZE = 50000
+_selection_cache = OrderedDict()  # selected Face identifiers keyed by guide and Room
+
+
+def guide_index(guide_faces, tolerance):
+    """Build a spatial grid that maps cells in 3D space to the guide Face3Ds within them.
+
+    The bounding box and plane of each guide Face3D are computed once here
+    so that they are cached on the Face3D for all of the Rooms that use them.
+
+    Args:
+        guide_faces: A list of Face3D for the guide surface.
+        tolerance: The distance by which the bounding box of each guide
+            Face3D is expanded when it is added to the grid.
+
+    Returns:
+        A tuple with the guide Face3Ds, the grid dictionary and the size of
+        each cell in the grid.
+    """
+    b_boxes = [(tuple(g.min), tuple(g.max)) for g in guide_faces]
+    cell_size = median_cell_size(b_boxes, tolerance)
+    grid, _ = bounding_box_grid(b_boxes, cell_size, tolerance)
+    return guide_faces, grid, cell_size
+
+
+def guides_near_room(room, g_index, tolerance):
+    """Get the guide Face3Ds with a bounding box that overlaps a Room's bounding box."""
+    guide_faces, grid, cell_size = g_index
+    near_i = grid_candidates(grid, cell_size, tuple(room.min), tuple(room.max),
+                             len(guide_faces))
+    return [guide_faces[i] for i in near_i
+            if overlapping_bounding_boxes(room.geometry, guide_faces[i], tolerance)]
+
+
+def faces_by_guide_surface(rooms, guide_faces, tolerance, angle_tolerance):
+    """Get the Faces of each Room that are touching and coplanar with the guide surface.
+
+    The guide index is keyed by the guide Face3Ds along with the tolerances
+    and the selections are keyed by the guide along with the identifier,
+    geometry and Face identifiers of each Room. The geometry objects themselves
+    are used in the keys so that geometry with the same hash is never mistaken
+    for the same geometry. Only the GUIDE_CACHE_SIZE and SELECTION_CACHE_SIZE
+    most recently used results are kept.
+
+    Args:
+        rooms: A list of honeybee Rooms from which Faces will be selected.
+        guide_faces: A list of Face3D for the guide surface.
+        tolerance: The maximum difference between point values for them to be
+            considered distinct from one another.
+        angle_tolerance: The max angle in degrees that the plane normals can
+            differ from one another in order for them to be considered coplanar.
+
+    Returns:
+        A list with a list of selected Faces for each input Room.
+    """
+    # get the cached guide index or build a new one if the guide has changed
+    guide_key = (tuple(guide_faces), tolerance, angle_tolerance)
+    try:
+        g_index = _guide_cache.pop(guide_key)  # pop it to put it back as the most recent
+    except KeyError:  # the guide has not been indexed yet
+        g_index = guide_index(guide_faces, tolerance)
+        if len(_guide_cache) >= GUIDE_CACHE_SIZE:
+            _guide_cache.popitem(last=False)  # remove the least recently used index
+    _guide_cache[guide_key] = g_index
+
+    # select the Faces of each Room, using the cached selections where possible
+    all_selected = []
+    for room in rooms:
+        key = (guide_key, room.identifier, room.geometry,
+               tuple(f.identifier for f in room.faces))
+        try:
+            sel_ids = _selection_cache.pop(key)  # pop it to put it back as the most recent
+        except KeyError:  # the Room has not been evaluated with the guide
+            near_guides = guides_near_room(room, g_index, tolerance)
+            sel_ids = set() if len(near_guides) == 0 else set(
+                f.identifier for f in room.faces_by_guide_surface(
+                    near_guides, tolerance=tolerance, angle_tolerance=angle_tolerance))
+            if len(_selection_cache) >= SELECTION_CACHE_SIZE:
+                _selection_cache.popitem(last=False)  # remove the least recent selection
+        _selection_cache[key] = sel_ids
+        all_selected.append([f for f in room.faces if f.identifier in sel_ids])
+    return all_selected
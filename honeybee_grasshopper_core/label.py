@@ -0,0 +1,168 @@
+"""Functions shared by the components that label honeybee objects.
+
+The anchors and text objects of the labels are cached in this module so that
+they are shared by all of the components that import it. So changing the
+attribute, font or text height of a label component only requires the cached
+anchors to be looked up for each object and only the text objects of labels
+that have changed are regenerated. Each cache only keeps a fixed number of the
+most recently used results.
+"""
+import math
+from collections import OrderedDict
+
+from ladybug_geometry.geometry3d import Vector3D, Point3D, Plane, Polyline3D, \
+    Face3D, Polyface3D
+
+from ladybug_rhino.text import text_objects
+from ladybug_rhino.grasshopper import run_function_in_parallel
+
+ANCHOR_CACHE_SIZE = 50000
+_anchor_cache = OrderedDict()  # label anchors keyed by anchor function and arguments
+LABEL_CACHE_SIZE = 50000
+_label_cache = OrderedDict()  # text objects keyed by text, plane, height and font
+
+
+def face_anchor(f_geo, p_tol):
+    """Get the base plane and dimensions used to label a Face3D.
+
+    Args:
+        f_geo: A ladybug_geometry Face3D to be labeled.
+        p_tol: The tolerance used to compute the pole of inaccessibility.
+
+    Returns:
+        A tuple with three items.
+
+        -   base_plane: A Plane that lies on the Face3D with its Y axis pointing
+            upwards, which the text of the label will be aligned with.
+
+        -   m_vec: A Vector3D along which the base_plane is moved by the text
+            height to avoid overlaps of adjacent labels.
+
+        -   dim: The middle dimension of the bounding box around the Face3D,
+            which is used to auto-calculate the text height.
+    """
+    cent_pt = f_geo.center if f_geo.is_convex else f_geo.pole_of_inaccessibility(p_tol)
+    base_plane = Plane(f_geo.normal, cent_pt)
+    if base_plane.y.z < 0:  # base plane pointing downwards; rotate it
+        base_plane = base_plane.rotate(base_plane.n, math.pi, base_plane.o)
+    if base_plane.n.x != 0:
+        m_vec = base_plane.y if base_plane.n.x < 0 else -base_plane.y
+    else:
+        m_vec = base_plane.y if base_plane.n.z < 0 else -base_plane.y
+    dims = [
+        (f_geo.max.x - f_geo.min.x),
+        (f_geo.max.y - f_geo.min.y),
+        (f_geo.max.z - f_geo.min.z)]
+    dims.sort()
+    return base_plane, m_vec, dims[1]
+
+
+def room_anchor(room_geo, floor_faces, tolerance, p_tol, max_move):
+    """Get the base plane and dimension used to label a Room.
+
+    Args:
+        room_geo: A ladybug_geometry Polyface3D for the Room to be labeled.
+        floor_faces: A tuple of Face3D for the Floors of the Room.
+        tolerance: The maximum difference between point values for them to be
+            considered distinct from one another.
+        p_tol: The tolerance used to compute the pole of inaccessibility.
+        max_move: The maximum distance that the base plane is moved above the
+            floor of the Room.
+
+    Returns:
+        A tuple with two items.
+
+        -   base_plane: A Plane above the center of the floor of the Room,
+            which the text of the label will be aligned with.
+
+        -   dim: The X dimension of the bounding box around the Room, which is
+            used to auto-calculate the text height.
+    """
+    # compute the center point for the text
+    room_h = room_geo.max.z - room_geo.min.z
+    m_vec = Vector3D(0, 0, max_move) if room_h > max_move * 2 \
+        else Vector3D(0, 0, room_h / 2)
+    if len(floor_faces) == 1:
+        flr_geo = floor_faces[0]
+        base_pt = flr_geo.center if flr_geo.is_convex else \
+            flr_geo.pole_of_inaccessibility(p_tol)
+    elif len(floor_faces) == 0:
+        c_pt = room_geo.center
+        base_pt = Point3D(c_pt.x, c_pt.y, room_geo.min.z)
+    else:
+        floor_p_face = Polyface3D.from_faces(floor_faces, tolerance)
+        floor_outline = Polyline3D.join_segments(floor_p_face.naked_edges, tolerance)[0]
+        flr_geo = Face3D(floor_outline.vertices[:-1])
+        base_pt = flr_geo.center if flr_geo.is_convex else \
+            flr_geo.pole_of_inaccessibility(p_tol)
+    base_pt = base_pt.move(m_vec)
+    return Plane(Vector3D(0, 0, 1), base_pt), room_geo.max.x - room_geo.min.x
+
+
+def label_anchors(anchor_func, anchor_args, cpu_count):
+    """Get the anchors of several labels using the shared anchor cache.
+
+    The cache is keyed by the anchor function along with the arguments of each
+    anchor, which include the geometry objects themselves. So a cached anchor
+    is only used when the geometry is equal rather than when it happens to
+    share a hash. The anchors that are not yet in the cache are computed in
+    parallel and only the ANCHOR_CACHE_SIZE most recently used anchors are kept.
+
+    Args:
+        anchor_func: The function used to compute each anchor, which is either
+            face_anchor or room_anchor.
+        anchor_args: A list with a tuple of arguments to anchor_func for each
+            label. All of the arguments must be hashable.
+        cpu_count: An integer for the number of CPUs used to compute the anchors.
+
+    Returns:
+        A list with the result of anchor_func for each tuple of arguments.
+    """
+    keys = [(anchor_func,) + tuple(args) for args in anchor_args]
+    anchors = [_anchor_cache.get(key) for key in keys]
+    missing = [i for i, anchor in enumerate(anchors) if anchor is None]
+
+    # compute the anchors that are not in the cache in parallel
+    def compute_anchor(count):
+        i = missing[count]
+        anchors[i] = anchor_func(*anchor_args[i])
+
+    if len(missing) != 0:
+        run_function_in_parallel(compute_anchor, len(missing), cpu_count)
+
+    # put all of the anchors back in the cache as the most recently used
+    for key, anchor in zip(keys, anchors):
+        _anchor_cache.pop(key, None)
+        _anchor_cache[key] = anchor
+    while len(_anchor_cache) > ANCHOR_CACHE_SIZE:
+        _anchor_cache.popitem(last=False)  # remove the least recently used anchor
+    return anchors
+
+
+def label_object(text, base_plane, txt_h, font):
+    """Get a text object for a label using the shared label cache.
+
+    The cache is keyed by the text, base plane, height and font of each label.
+    So, when the labels are recomputed, only the text objects of labels that
+    have changed are regenerated. Only the LABEL_CACHE_SIZE most recently used
+    labels are kept.
+
+    Args:
+        text: Text for the label.
+        base_plane: A ladybug_geometry Plane for the location of the label.
+        txt_h: A number for the height of the text.
+        font: Text for the name of the font in which the label will display.
+
+    Returns:
+        A text object for the label.
+    """
+    key = (text, base_plane, txt_h, font)
+    try:
+        label = _label_cache.pop(key)  # pop it to put it back as the most recent
+    except KeyError:  # the label has not been created yet
+        label = text_objects(text, base_plane, txt_h, font=font,
+                             horizontal_alignment=1, vertical_alignment=3)
+        if len(_label_cache) >= LABEL_CACHE_SIZE:
+            _label_cache.popitem(last=False)  # remove the least recently used label
+    _label_cache[key] = label
+    return label
@@ -0,0 +1,65 @@
+"""Functions for looking up objects in the honeybee libraries by their identifiers.
+
+The objects that are looked up are shared by all of the components in a
+Grasshopper document and they are cleared at the end of each solution of the
+document. So every identifier is only looked up once per solution and the same
+object is assigned everywhere that the identifier is used, while edits to the
+user library are picked up by the next solution.
+"""
+
+_lookups = {}  # library objects keyed by the lookup functions and identifier
+_documents = set()  # the IDs of documents that clear the lookups on solution end
+
+
+def clear_lookups(*args):
+    """Clear all of the library objects that have been looked up.
+
+    This function is called at the end of each solution of a Grasshopper
+    document and the input args are the sender and the event arguments,
+    which are not used.
+    """
+    _lookups.clear()
+
+
+def track_solution(component):
+    """Clear the lookups at the end of each solution of a component's document.
+
+    This only subscribes to the SolutionEnd event once for each document
+    so it can be called every time that a component runs.
+
+    Args:
+        component: The Grasshopper component that is looking up objects,
+            which is usually ghenv.Component.
+    """
+    document = component.OnPingDocument()
+    if document is None:  # the component is not in a document
+        return
+    doc_id = str(document.DocumentID)
+    if doc_id not in _documents:
+        document.SolutionEnd += clear_lookups
+        _documents.add(doc_id)
+
+
+def lookup_by_identifier(identifier, *lookup_funcs):
+    """Get an object from a library using its identifier, reusing earlier lookups.
+
+    Args:
+        identifier: Text for the identifier of the object in the library.
+        lookup_funcs: Functions to look up the identifier in the library,
+            which are tried in order until one of them finds the object.
+    """
+    key = (lookup_funcs, identifier)
+    try:
+        return _lookups[key]
+    except KeyError:  # the first time that the identifier is used
+        pass
+    for lookup_func in lookup_funcs[:-1]:
+        try:
+            obj = lookup_func(identifier)
+            break
+        except ValueError:  # not found in this part of the library
+            pass
+    else:
+        obj = lookup_funcs[-1](identifier)
+    _lookups[key] = obj
+    return obj
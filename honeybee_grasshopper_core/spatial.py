@@ -0,0 +1,120 @@
+"""Functions for indexing objects in a uniform spatial grid of cells.
+
+Each object is placed into the grid cells that its bounding box overlaps so
+that the objects near a given bounding box can be found by only checking the
+cells that it overlaps instead of checking every object. The bounding boxes
+are tuples with the minimum and maximum coordinates, which can be (x, y, z)
+tuples for a 3D grid or (x, y) tuples for a 2D grid in the XY plane.
+"""
+import math
+
+
+def grid_cell_ranges(min_pt, max_pt, cell_size, dist=0):
+    """Get the ranges of grid cell indices along each axis that overlap a bounding box.
+
+    Args:
+        min_pt: A tuple of coordinates for the minimum of the bounding box.
+        max_pt: A tuple of coordinates for the maximum of the bounding box.
+        cell_size: A number for the dimension of each grid cell.
+        dist: A distance by which the bounding box will be expanded. (Default: 0).
+
+    Returns:
+        A list with a range of cell indices for each coordinate of the box.
+    """
+    return [range(int(math.floor((mn - dist) / cell_size)),
+                  int(math.floor((mx + dist) / cell_size)) + 1)
+            for mn, mx in zip(min_pt, max_pt)]
+
+
+def grid_cell_keys(cell_ranges):
+    """Get the keys of all grid cells within a list of ranges from grid_cell_ranges."""
+    keys = [()]
+    for rng in cell_ranges:
+        keys = [key + (i,) for key in keys for i in rng]
+    return keys
+
+
+def cell_count(cell_ranges):
+    """Get the number of grid cells within a list of ranges from grid_cell_ranges."""
+    count = 1
+    for rng in cell_ranges:
+        count *= len(rng)
+    return count
+
+
+def median_cell_size(b_boxes, min_size):
+    """Get a grid cell size from the median dimension of a list of bounding boxes.
+
+    Args:
+        b_boxes: A list of bounding boxes where each box is a tuple with the
+            minimum and maximum coordinate tuples.
+        min_size: A number for the smallest cell size to be returned, which
+            is also returned when there are no bounding boxes.
+    """
+    dims = sorted(max(mx - mn for mn, mx in zip(min_pt, max_pt))
+                  for min_pt, max_pt in b_boxes)
+    return max(dims[int(len(dims) / 2)], min_size) if len(dims) != 0 else min_size
+
+
+def bounding_box_grid(b_boxes, cell_size, dist=0, max_cells=None):
+    """Build a grid that maps grid cells to the bounding boxes that overlap them.
+
+    Args:
+        b_boxes: A list of bounding boxes where each box is a tuple with the
+            minimum and maximum coordinate tuples.
+        cell_size: A number for the dimension of each grid cell.
+        dist: A distance by which each bounding box will be expanded. (Default: 0).
+        max_cells: An optional integer for the maximum number of cells that a
+            bounding box can overlap before it is left out of the grid. This is
+            useful when it is faster to check large objects against all other
+            objects than to add them to many cells. (Default: None).
+
+    Returns:
+        A tuple with two items.
+
+        -   grid: A dictionary with grid cell keys and lists of the indices of
+            the bounding boxes that overlap each cell.
+
+        -   large_boxes: A list with the indices of the bounding boxes that
+            overlap more than the max_cells and were not added to the grid.
+    """
+    grid, large_boxes = {}, []
+    for i, (min_pt, max_pt) in enumerate(b_boxes):
+        cell_ranges = grid_cell_ranges(min_pt, max_pt, cell_size, dist)
+        if max_cells is not None and cell_count(cell_ranges) > max_cells:
+            large_boxes.append(i)
+            continue
+        for key in grid_cell_keys(cell_ranges):
+            try:
+                grid[key].append(i)
+            except KeyError:  # the first bounding box in the cell
+                grid[key] = [i]
+    return grid, large_boxes
+
+
+def grid_candidates(grid, cell_size, min_pt, max_pt, count, dist=0):
+    """Get the indices of the objects in the grid cells that overlap a bounding box.
+
+    Args:
+        grid: A grid dictionary from the bounding_box_grid function.
+        cell_size: The dimension of each cell that was used to build the grid.
+        min_pt: A tuple of coordinates for the minimum of the bounding box.
+        max_pt: A tuple of coordinates for the maximum of the bounding box.
+        count: The number of objects that were used to build the grid. If the
+            bounding box overlaps more cells than this, all object indices are
+            returned since checking every object is faster than every cell.
+        dist: A distance by which the bounding box will be expanded. (Default: 0).
+
+    Returns:
+        A sorted list of the indices of the candidate objects.
+    """
+    cell_ranges = grid_cell_ranges(min_pt, max_pt, cell_size, dist)
+    if cell_count(cell_ranges) > count:
+        return list(range(count))  # faster to check all objects than all cells
+    candidates = set()
+    for key in grid_cell_keys(cell_ranges):
+        try:
+            candidates.update(grid[key])
+        except KeyError:  # no objects in the cell
+            pass
+    return sorted(candidates)
@@ -23,6 +23,11 @@ Add a Honeybee Aperture or Door to a parent Face or Room.
             of the parent Face will be projected and added. Otherwise,
             Apertures/Doors will only be added if they are coplanar and fully
             bounded by a parent Face.
+        _cpu_count_: An integer to set the number of CPUs used to check the sub-faces
+            of each parent Face and to trim projected sub-faces. If unspecified,
+            it will automatically default to one less than the number of CPUs
+            currently available on the machine or 1 if only one processor
+            is available.
 
     Returns:
         report: Reports, errors, warnings, etc.
@@ -40,6 +45,7 @@ ghenv.Component.SubCategory = '0 :: Create'
 ghenv.Component.AdditionalHelpFromDocStrings = "4"
 
 import math
+import threading
 
 try:  # import the core honeybee dependencies
     from ladybug_geometry.bounding import overlapping_bounding_boxes
@@ -58,15 +64,23 @@ except ImportError as e:
 
 try:  # import the ladybug_rhino dependencies
     from ladybug_rhino.config import current_tolerance, angle_tolerance
-    from ladybug_rhino.grasshopper import all_required_inputs, give_warning
+    from ladybug_rhino.grasshopper import all_required_inputs, give_warning, \
+        recommended_processor_count, run_function_in_parallel
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.spatial import median_cell_size, bounding_box_grid, \
+        grid_candidates
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
 tolerance = current_tolerance()
 a_tol_min = math.radians(angle_tolerance)  # min tolerance for projection
 a_tol_max = math.pi - angle_tolerance  # max tolerance for projection
 already_added_ids = set()  # track whether a given sub-face is already added
 indoor_faces = {}
+claim_lock = threading.Lock()  # lock to update sub-face claims across workers
 
 
 def add_sub_face(face, sub_face):
@@ -77,44 +91,119 @@ def add_sub_face(face, sub_face):
         face.add_door(sub_face)
 
 
-def check_and_add_sub_face(face, sub_faces, dist):
-    """Check whether a sub-face is valid for a face and, if so, add it."""
-    for i, sf in enumerate(sub_faces):
-        if overlapping_bounding_boxes(face.geometry, sf.geometry, dist):
-            sf_to_add = None
-            if project_dist_ is None:  # just check if it is a valid subface
-                if face.geometry.is_sub_face(sf.geometry, tolerance, angle_tolerance):
-                    sf_to_add = sf
-            else:
-                ang = sf.normal.angle(face.normal)
-                if ang < a_tol_min or ang > a_tol_max:
-                    clean_pts = [face.geometry.plane.project_point(pt)
-                                 for pt in sf.geometry.boundary]
-                    sf = sf.duplicate()
-                    sf._geometry = Face3D(clean_pts)
-                    sf_to_add = sf
-
-            if sf_to_add is not None:  # add the subface to the parent
-                if isinstance(face.boundary_condition, Surface):
-                    try:
-                        indoor_faces[face.identifier][1].append(sf)
-                    except KeyError:  # the first time we're encountering the face
-                        indoor_faces[face.identifier] = [face, [sf]]
-                    unmatched_sfs[i] = None
-                else:
-                    if sf.identifier in already_added_ids:
-                        sf = sf.duplicate()  # make sure the sub-face isn't added twice
-                        sf.add_prefix('Ajd')
-                    already_added_ids.add(sf.identifier)
-                    unmatched_sfs[i] = None
-                    add_sub_face(face, sf)
+def sub_face_grid(sub_faces, dist):
+    """Build a spatial grid that maps cells in 3D space to the sub-faces within them.
+
+    Args:
+        sub_faces: A list of Apertures and/or Doors to be indexed.
+        dist: The distance within which a sub-face can be matched to a parent
+            Face, which is used to expand the bounding box of each sub-face.
+
+    Returns:
+        A tuple with the grid dictionary, the size of each cell in the grid
+        and the number of sub-faces in the grid.
+    """
+    b_boxes = [(tuple(sf.geometry.min), tuple(sf.geometry.max)) for sf in sub_faces]
+    cell_size = median_cell_size(b_boxes, max(dist, tolerance))
+    grid, _ = bounding_box_grid(b_boxes, cell_size, dist)
+    return grid, cell_size, len(sub_faces)
+
+
+def candidate_sub_faces(face, sf_grid):
+    """Get the indices of sub-faces in the grid cells that overlap a parent Face."""
+    grid, cell_size, sf_count = sf_grid
+    return grid_candidates(grid, cell_size, tuple(face.geometry.min),
+                           tuple(face.geometry.max), sf_count)
+
+
+def sub_face_side(face, sf):
+    """Get 0 if a parent Face points the same way as a sub-face and 1 if it is opposite."""
+    return 0 if sf.normal.angle(face.normal) < math.pi / 2 else 1
+
+
+def claim_sub_face(claims, sf_i, side, face_i):
+    """Claim a side of a sub-face for a parent Face if no earlier Face has claimed it.
+
+    Returns:
+        True if the sub-face side is now claimed by the Face. False if it was
+        already claimed by a Face that comes earlier in the list of parents.
+    """
+    with claim_lock:
+        current = claims[sf_i][side]
+        if current is not None and current < face_i:
+            return False
+        claims[sf_i][side] = face_i
+        return True
+
+
+def match_sub_faces(face_i, face, sub_faces, dist, sf_grid, claims):
+    """Get the sub-faces that are valid for a parent Face without adding them.
+
+    Without a project_dist_, each side of a sub-face can only belong to one
+    parent Face since coplanar parent Faces pointing the same way cannot both
+    bound the sub-face unless they overlap. So sub-faces are claimed by the
+    earliest matching Face on each side (the claims being shared across all
+    workers) and a claimed side is not tested again by later Faces. The back
+    side stays available for the Face of an adjacent Room. With a
+    project_dist_, sub-faces can straddle several parents and are never skipped.
+
+    Returns:
+        A list of tuples with the index of each valid sub-face and the sub-face
+        object to be added (a projected duplicate if project_dist_ is specified).
+    """
+    matches = []
+    for i in candidate_sub_faces(face, sf_grid):
+        sf = sub_faces[i]
+        if project_dist_ is None:  # check if it is a valid and unclaimed subface
+            side = sub_face_side(face, sf)
+            claimed = claims[i][side]
+            if claimed is not None and claimed < face_i:
+                continue  # an earlier parent Face already has this sub-face
+            if overlapping_bounding_boxes(face.geometry, sf.geometry, dist) and \
+                    face.geometry.is_sub_face(sf.geometry, tolerance, angle_tolerance):
+                if claim_sub_face(claims, i, side, face_i):
+                    matches.append((i, sf))
+        elif overlapping_bounding_boxes(face.geometry, sf.geometry, dist):
+            ang = sf.normal.angle(face.normal)
+            if ang < a_tol_min or ang > a_tol_max:
+                clean_pts = [face.geometry.plane.project_point(pt)
+                             for pt in sf.geometry.boundary]
+                sf = sf.duplicate()
+                sf._geometry = Face3D(clean_pts)
+                claim_sub_face(claims, i, 0 if ang < a_tol_min else 1, face_i)
+                matches.append((i, sf))
+    return matches
+
+
+def add_matched_sub_faces(face_i, face, matches, claims):
+    """Add the sub-faces matched to a parent Face.
+
+    This function must be run in the order of the parent Faces so that each
+    sub-face object is owned by exactly one parent, which is the first Face
+    to match it. Any other matching Faces receive a prefixed duplicate.
+    """
+    for i, sf in matches:
+        if project_dist_ is None and \
+                claims[i][sub_face_side(face, sf)] != face_i:
+            continue  # an earlier Face claimed the sub-face after it was matched
+        if sf.identifier in already_added_ids:
+            sf = sf.duplicate()  # make sure the sub-face isn't added twice
+            sf.add_prefix('Ajd')
+        already_added_ids.add(sf.identifier)
+        if isinstance(face.boundary_condition, Surface):
+            try:
+                indoor_faces[face.identifier][1].append(sf)
+            except KeyError:  # the first time we're encountering the face
+                indoor_faces[face.identifier] = [face, [sf]]
+        else:
+            add_sub_face(face, sf)
 
 
 if all_required_inputs(ghenv.Component):
     # duplicate the initial objects
     hb_obj = [obj.duplicate() for obj in _hb_obj]
     sub_faces = [sf.duplicate() for sf in _sub_faces]
-    unmatched_sfs = sub_faces[:]  # copy the input list
+    claims = [[None, None] for _ in sub_faces]  # parent Face index for each side
 
     # gather all of the parent Faces to be checked
     rel_faces = []
@@ -126,9 +215,21 @@ if all_required_inputs(ghenv.Component):
         else:
             raise TypeError('Expected Honeybee Face, Room or Model. '
                             'Got {}.'.format(type(obj)))
+    workers = _cpu_count_ if _cpu_count_ is not None else recommended_processor_count()
     dist = tolerance if project_dist_ is None else project_dist_
-    for face in rel_faces:
-        check_and_add_sub_face(face, sub_faces, dist)
+    if len(sub_faces) != 0:
+        # find the valid sub-faces of each parent Face in parallel
+        sf_grid = sub_face_grid(sub_faces, dist)
+        face_matches = [None] * len(rel_faces)
+
+        def match_face(count):
+            face_matches[count] = match_sub_faces(
+                count, rel_faces[count], sub_faces, dist, sf_grid, claims)
+        run_function_in_parallel(match_face, len(rel_faces), workers)
+
+        # add the sub-faces to their parents in order
+        for face_i, (face, matches) in enumerate(zip(rel_faces, face_matches)):
+            add_matched_sub_faces(face_i, face, matches, claims)
 
     # for any Faces with a Surface boundary condition, add subfaces as a pair
     already_adj_ids = set()
@@ -157,14 +258,16 @@ if all_required_inputs(ghenv.Component):
 
     # if a project_dist_ was specified, trim the apertures with the Face geometry
     if project_dist_ is not None:
-        for face in rel_faces:
-            if face.has_sub_faces:
-                face.fix_invalid_sub_faces(
-                    trim_with_parent=True, union_overlaps=False,
-                    offset_distance=tolerance * 5, tolerance=tolerance)
+        fix_faces = [face for face in rel_faces if face.has_sub_faces]
+
+        def fix_face(count):
+            fix_faces[count].fix_invalid_sub_faces(
+                trim_with_parent=True, union_overlaps=False,
+                offset_distance=tolerance * 5, tolerance=tolerance)
+        run_function_in_parallel(fix_face, len(fix_faces), workers)
 
     # if any of the sub-faces were not added, give a warning
-    unmatched = [sf for sf in unmatched_sfs if sf is not None]
+    unmatched = [sf for sf, claim in zip(sub_faces, claims) if claim == [None, None]]
     unmatched_ids = [sf.display_name for sf in unmatched]
     msg = 'The following sub-faces were not matched with any parent Face:' \
         '\n{}'.format('\n'.join(unmatched_ids))
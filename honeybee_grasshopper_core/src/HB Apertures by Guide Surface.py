@@ -76,6 +76,11 @@ try:  # import the ladybug_rhino dependencies
     from ladybug_rhino.grasshopper import all_required_inputs
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
+
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.guide import faces_by_guide_surface
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
 tolerance = current_tolerance()
 
 
@@ -105,9 +110,8 @@ if all_required_inputs(ghenv.Component):
     operable_ = operable_ if operable_ is not None else False
 
     # loop through the rooms and set the face properties
-    for room in rooms:
-        select_faces = room.faces_by_guide_surface(
-            guide_faces, tolerance=tolerance, angle_tolerance=angle_tolerance)
+    for select_faces in faces_by_guide_surface(
+            rooms, guide_faces, tolerance, angle_tolerance):
         for hb_face in select_faces:
             if isinstance(hb_face.boundary_condition, Outdoors):
                 assign_apertures(hb_face, _subdivide_, _ratio, _win_height_,
@@ -50,7 +50,7 @@ ghenv.Component.SubCategory = '1 :: Visualize'
 ghenv.Component.AdditionalHelpFromDocStrings = '3'
 
 try:
-    from ladybug_geometry.geometry3d import Face3D
+    from ladybug_geometry.geometry3d import Face3D, Polyline3D
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_geometry:\n\t{}'.format(e))
 
@@ -65,27 +65,28 @@ try:  # import the core honeybee dependencies
     from honeybee.face import Face
     from honeybee.shademesh import ShadeMesh
     from honeybee.colorobj import ColorFace
-    from honeybee.search import get_attr_nested
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
 
 try:  # import the ladybug_rhino dependencies
-    from ladybug_rhino.fromgeometry import from_face3ds_to_colored_mesh, \
-        from_face3d_to_wireframe, from_mesh3ds_to_colored_mesh, \
-        from_mesh3d_to_wireframe
+    from ladybug_rhino.fromgeometry import from_mesh3ds_to_colored_mesh, \
+        from_linesegment3d, from_polyline3d
     from ladybug_rhino.fromobjects import legend_objects
     from ladybug_rhino.color import color_to_color
-    from ladybug_rhino.config import units_system
+    from ladybug_rhino.config import units_system, current_tolerance
     from ladybug_rhino.grasshopper import all_required_inputs
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
-# dictionary of unit-sensitive propperties to be handled specially
-UNIT_SENSITIVE = {
-    'properties.energy.r_factor': 'R Factor',
-    'properties.energy.u_factor': 'U Factor',
-    'properties.energy.shgc': 'SHGC'
-}
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.visualize import triangulated_mesh3d, \
+        welded_edges
+    from honeybee_grasshopper_core.attribute import UNIT_SENSITIVE, \
+        unit_sensitive_values
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
+tolerance = current_tolerance()
 
 
 if all_required_inputs(ghenv.Component):
@@ -112,18 +113,16 @@ if all_required_inputs(ghenv.Component):
     # if the U-factor is requested, compute it in a unit-sensitive way
     if _attribute in UNIT_SENSITIVE:
         nd = color_obj.legend_parameters.decimal_count
-        units = units_system()
-        values, flat_geo = [], []
-        for face_obj in color_obj.flat_faces:
-            try:
-                obj_method = get_attr_nested(face_obj, _attribute, cast_to_str=False)
-                values.append(round(obj_method(units), nd))
-                if isinstance(face_obj, Face):
-                    flat_geo.append(face_obj.punched_geometry)
-                else:
-                    flat_geo.append(face_obj.geometry)
-            except TypeError:
-                pass  # shade geometry
+        values, flat_geo, flat_ids = [], [], []
+        unit_values = unit_sensitive_values(
+            color_obj.flat_faces, _attribute, units_system())
+        for face_obj, geo, val in zip(color_obj.flat_faces, color_obj.flat_geometry,
+                                      unit_values):
+            if isinstance(val, str):
+                continue  # shade geometry
+            values.append(round(val, nd))
+            flat_geo.append(geo)
+            flat_ids.append(face_obj.identifier)
         l_par = color_obj.legend_parameters.duplicate()
         l_par.title = UNIT_SENSITIVE[_attribute]
         graphic = GraphicContainer(values, color_obj.min_point, color_obj.max_point, l_par)
@@ -136,20 +135,19 @@ if all_required_inputs(ghenv.Component):
         graphic = color_obj.graphic_container
         values = color_obj.attributes_original
         flat_geo = color_obj.flat_geometry
+        flat_ids = [face_obj.identifier for face_obj in color_obj.flat_faces]
 
     # output the visualization geometry
     mesh = []
-    for fc, col in zip(flat_geo, graphic.value_colors):
+    for f_id, fc, col in zip(flat_ids, flat_geo, graphic.value_colors):
         if isinstance(fc, Face3D):
-            mesh.append(from_face3ds_to_colored_mesh([fc], col))
+            tri_mesh = triangulated_mesh3d(f_id, fc)
+            tri_meshes = [tri_mesh] if tri_mesh is not None else []
+            mesh.append(from_mesh3ds_to_colored_mesh(tri_meshes, col))
         else:
             mesh.append(from_mesh3ds_to_colored_mesh([fc], col))
-    wire_frame = []
-    for face in flat_geo:
-        if isinstance(face, Face3D):
-            wire_frame.extend(from_face3d_to_wireframe(face))
-        else:
-            wire_frame.extend(from_mesh3d_to_wireframe(face))
+    wire_frame = [from_polyline3d(pl) if isinstance(pl, Polyline3D) else
+                  from_linesegment3d(pl) for pl in welded_edges(flat_geo, tolerance)]
     legend = legend_objects(graphic.legend)
     colors = [color_to_color(col) for col in graphic.value_colors]
     vis_set = color_obj
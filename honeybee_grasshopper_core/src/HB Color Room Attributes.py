@@ -49,21 +49,36 @@ ghenv.Component.Category = 'Honeybee'
 ghenv.Component.SubCategory = '1 :: Visualize'
 ghenv.Component.AdditionalHelpFromDocStrings = '3'
 
+try:  # import the ladybug_geometry dependencies
+    from ladybug_geometry.geometry3d import Polyline3D
+except ImportError as e:
+    raise ImportError('\nFailed to import ladybug_geometry:\n\t{}'.format(e))
+
 try:  # import the core honeybee dependencies
     from honeybee.model import Model
     from honeybee.colorobj import ColorRoom
+    from honeybee.facetype import Floor
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
 
 try:  # import the ladybug_rhino dependencies
-    from ladybug_rhino.fromgeometry import from_face3ds_to_colored_mesh, \
-        from_polyface3d_to_wireframe
+    from ladybug_rhino.fromgeometry import from_mesh3ds_to_colored_mesh, \
+        from_linesegment3d, from_polyline3d
     from ladybug_rhino.fromobjects import legend_objects
     from ladybug_rhino.color import color_to_color
+    from ladybug_rhino.config import current_tolerance
     from ladybug_rhino.grasshopper import all_required_inputs
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.visualize import triangulated_mesh3d, \
+        welded_edges
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
+tolerance = current_tolerance()
+
 
 if all_required_inputs(ghenv.Component):
     # extract any rooms from input Models
@@ -77,11 +92,14 @@ if all_required_inputs(ghenv.Component):
     # create the ColorRoom visualization object and output geometry
     color_obj = ColorRoom(rooms, _attribute, legend_par_)
     graphic = color_obj.graphic_container
-    mesh = [from_face3ds_to_colored_mesh(flrs, col) for flrs, col in
-            zip(color_obj.floor_faces, graphic.value_colors)]
-    wire_frame = []
-    for room in rooms:
-        wire_frame.extend(from_polyface3d_to_wireframe(room.geometry))
+    mesh = []
+    for room, col in zip(color_obj.rooms, graphic.value_colors):
+        flrs = [triangulated_mesh3d(face.identifier, face.geometry)
+                for face in room.faces if isinstance(face.type, Floor)]
+        mesh.append(from_mesh3ds_to_colored_mesh([f for f in flrs if f is not None], col))
+    wire_frame = [from_polyline3d(pl) if isinstance(pl, Polyline3D) else
+                  from_linesegment3d(pl) for pl in
+                  welded_edges([room.geometry for room in rooms], tolerance)]
     legend = legend_objects(graphic.legend)
     values = color_obj.attributes_original
     colors = [color_to_color(col) for col in graphic.value_colors]
@@ -27,6 +27,10 @@ this is intersection should be done prior to the creation of the Honeybee Rooms.
             ground boundary conditions to the _rooms (False) or it resets
             all existing ground boundary conditions to only exist at or below
             the _ground geometry (True). (Default: False).
+        _cpu_count_: An integer to set the number of CPUs used to set the ground
+            boundary conditions of the Rooms. If unspecified, it will
+            automatically default to one less than the number of CPUs currently
+            available on the machine or 1 if only one processor is available.
 
     Returns:
         rooms: The input Rooms with their Ground boundary conditions set.
@@ -47,10 +51,54 @@ except ImportError as e:
 try:  # import the ladybug_rhino dependencies
     from ladybug_rhino.config import current_tolerance, angle_tolerance
     from ladybug_rhino.togeometry import to_face3d
-    from ladybug_rhino.grasshopper import all_required_inputs
+    from ladybug_rhino.grasshopper import all_required_inputs, \
+        recommended_processor_count, run_function_in_parallel
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.spatial import median_cell_size, bounding_box_grid, \
+        grid_candidates
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
+
+def ground_grid(ground_faces, tolerance):
+    """Build a grid that maps cells in the XY plane to the ground Face3Ds above them.
+
+    Args:
+        ground_faces: A list of Face3D for the ground.
+        tolerance: The distance by which the bounding box of each ground
+            Face3D is expanded when it is added to the grid.
+
+    Returns:
+        A tuple with the grid dictionary and the size of each cell in the grid.
+    """
+    b_boxes = [((g.min.x, g.min.y), (g.max.x, g.max.y)) for g in ground_faces]
+    cell_size = median_cell_size(b_boxes, tolerance)
+    grid, _ = bounding_box_grid(b_boxes, cell_size, tolerance)
+    return grid, cell_size
+
+
+def ground_near_room(room, ground_faces, g_grid, tolerance):
+    """Get the ground Face3Ds that can touch or lie above a Room.
+
+    Room Faces can only get a Ground boundary condition if a ground Face3D
+    is above their center or coplanar with them. So only ground Face3Ds with
+    an XY bounding box that overlaps the Room and a maximum Z above the
+    bottom of the Room are returned, in the order of the ground_faces.
+    """
+    grid, cell_size = g_grid
+    r_min, r_max = room.min, room.max
+    near_i = grid_candidates(grid, cell_size, (r_min.x, r_min.y), (r_max.x, r_max.y),
+                             len(ground_faces))
+    return [ground_faces[i] for i in near_i
+            if ground_faces[i].max.z >= r_min.z - tolerance and
+            ground_faces[i].min.x <= r_max.x + tolerance and
+            ground_faces[i].max.x >= r_min.x - tolerance and
+            ground_faces[i].min.y <= r_max.y + tolerance and
+            ground_faces[i].max.y >= r_min.y - tolerance]
+
 
 if all_required_inputs(ghenv.Component):
     # process the inputs
@@ -65,6 +113,15 @@ if all_required_inputs(ghenv.Component):
                 if isinstance(face.boundary_condition, Ground):
                     face.boundary_condition = boundary_conditions.outdoors
 
-    # loop through the rooms and set the ground boundary conditions
-    for room in rooms:
-        room.ground_by_custom_surface(ground_faces, tolerance, angle_tolerance)
+    # set the ground boundary conditions using only the ground near each room
+    if len(ground_faces) != 0:
+        workers = _cpu_count_ if _cpu_count_ is not None \
+            else recommended_processor_count()
+        g_grid = ground_grid(ground_faces, tolerance)
+
+        def ground_room(count):
+            room = rooms[count]
+            near_ground = ground_near_room(room, ground_faces, g_grid, tolerance)
+            if len(near_ground) != 0:
+                room.ground_by_custom_surface(near_ground, tolerance, angle_tolerance)
+        run_function_in_parallel(ground_room, len(rooms), workers)
@@ -67,6 +67,11 @@ try:  # import the ladybug_rhino dependencies
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.lookup import lookup_by_identifier, track_solution
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
 try:  # import the honeybee-energy extension
     from honeybee_energy.lib.constructions import shade_construction_by_identifier
 except ImportError as e:
@@ -98,6 +103,9 @@ def assign_shades(aperture, depth, indoor, ep, rad):
 
 
 if all_required_inputs(ghenv.Component):
+    # share the library lookups with other components until the solution ends
+    track_solution(ghenv.Component)
+
     # duplicate the initial objects
     hb_objs = [obj.duplicate() for obj in _hb_objs]
 
@@ -108,7 +116,8 @@ if all_required_inputs(ghenv.Component):
     if len(ep_constr_) != 0:
         for i, constr in enumerate(ep_constr_):
             if isinstance(constr, str):
-                ep_constr_[i] = shade_construction_by_identifier(constr)
+                ep_constr_[i] = lookup_by_identifier(
+                    constr, shade_construction_by_identifier)
     else:
         ep_constr_ = [None]
 
@@ -116,7 +125,7 @@ if all_required_inputs(ghenv.Component):
     if len(rad_mod_) != 0:
         for i, mod in enumerate(rad_mod_):
             if isinstance(mod, str):
-                rad_mod_[i] = modifier_by_identifier(mod)
+                rad_mod_[i] = lookup_by_identifier(mod, modifier_by_identifier)
     else:
         rad_mod_ = [None]
 
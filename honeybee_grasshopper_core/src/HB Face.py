@@ -71,6 +71,11 @@ try:  # import the ladybug_rhino dependencies
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.lookup import lookup_by_identifier, track_solution
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
 try:  # import the honeybee-energy extension
     from honeybee_energy.lib.constructions import opaque_construction_by_identifier
 except ImportError as e:
@@ -87,6 +92,9 @@ except ImportError as e:
 
 
 if all_required_inputs(ghenv.Component):
+    # share the library lookups with other components until the solution ends
+    track_solution(ghenv.Component)
+
     faces = []  # list of faces that will be returned
     for j, geo in enumerate(_geo):
         if len(_name_) == 0:  # make a default Face name
@@ -112,14 +120,15 @@ if all_required_inputs(ghenv.Component):
             if len(ep_constr_) != 0:
                 ep_constr = longest_list(ep_constr_, j)
                 if isinstance(ep_constr, str):
-                    ep_constr = opaque_construction_by_identifier(ep_constr)
+                    ep_constr = lookup_by_identifier(
+                        ep_constr, opaque_construction_by_identifier)
                 hb_face.properties.energy.construction = ep_constr
 
             # try to assign the radiance modifier
             if len(rad_mod_) != 0:
                 rad_mod = longest_list(rad_mod_, j)
                 if isinstance(rad_mod, str):
-                    rad_mod = modifier_by_identifier(rad_mod)
+                    rad_mod = lookup_by_identifier(rad_mod, modifier_by_identifier)
                 hb_face.properties.radiance.modifier = rad_mod
 
             faces.append(hb_face)  # collect the final Faces
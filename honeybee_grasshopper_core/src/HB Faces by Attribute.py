@@ -46,7 +46,6 @@ try:  # import the core honeybee dependencies
     from honeybee.model import Model
     from honeybee.room import Room
     from honeybee.face import Face
-    from honeybee.colorobj import ColorFace
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
 
@@ -56,6 +55,12 @@ try:  # import the ladybug_rhino dependencies
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.attribute import attribute_values, \
+        display_attributes, flatten_faces
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
 
 if all_required_inputs(ghenv.Component):
     # extract any faces from input Rooms or Models
@@ -79,26 +84,28 @@ if all_required_inputs(ghenv.Component):
             msg = 'Expected Face, Room or Model. Got {}.'.format(type(hb_obj))
             raise TypeError(msg)
 
-    # use the ColorFace object to get a set of attributes assigned to the faces
-    color_obj = ColorFace(faces, _attribute)
+    # get the attributes assigned to the faces and their sub-faces
+    flat_faces = flatten_faces(faces)
+    attributes, attributes_unique = \
+        display_attributes(attribute_values(flat_faces, _attribute))
 
     # loop through each of the hb_objs and get the attribute
     if len(value_) == 0:
-        values = color_obj.attributes_unique
+        values = attributes_unique
+        value_i = {val: i for i, val in enumerate(values)}
         hb_objs = [[] for val in values]
-        for atr, face in zip(color_obj.attributes, color_obj.flat_faces):
-            atr_i = values.index(atr)
-            hb_objs[atr_i].append(face)
+        for atr, face in zip(attributes, flat_faces):
+            hb_objs[value_i[atr]].append(face)
     else:
         values = []
-        for unique_atr in color_obj.attributes_unique:
+        for unique_atr in attributes_unique:
             for kw in value_:
                 if kw.lower() in str(unique_atr).lower():
                     values.append(unique_atr)
                     break
+        value_i = {val: i for i, val in enumerate(values)}
         hb_objs = [[] for val in values]
-        for atr, face in zip(color_obj.attributes, color_obj.flat_faces):
-            if atr in values:
-                atr_i = values.index(atr)
-                hb_objs[atr_i].append(face)
+        for atr, face in zip(attributes, flat_faces):
+            if atr in value_i:
+                hb_objs[value_i[atr]].append(face)
     hb_objs = list_to_data_tree(hb_objs)
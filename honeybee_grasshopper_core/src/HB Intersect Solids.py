@@ -24,6 +24,15 @@ interior faces when their surface areas do not match.
             intersection calculation. If unspecified, it will automatically default
             to one less than the number of CPUs currently available on the
             machine or 1 if only one processor is available.
+        cache_: Set to True to remember the split geometry of each object between
+            runs of this component, keyed by its identifier, geometry and the
+            tolerances along with the objects it was split against. On the next
+            run, only objects that have changed along with their overlapping
+            neighbors will be intersected with their neighbors while all other
+            Rooms are quickly re-split with their cached geometry. This is useful
+            for massing studies where one block is moved at a time. Only the
+            geometry is cached such that the output Rooms always have the
+            properties of the input Rooms. (Default: False).
         _run: Set to True to run the component.
 
     Returns:
@@ -38,6 +47,12 @@ ghenv.Component.Category = 'Honeybee'
 ghenv.Component.SubCategory = '0 :: Create'
 ghenv.Component.AdditionalHelpFromDocStrings = '2'
 
+import threading
+
+try:  # import the Rhino document dependencies
+    import scriptcontext as sc
+except ImportError as e:
+    raise ImportError('\nFailed to import scriptcontext:\n\t{}'.format(e))
 
 try:  # import the honeybee dependencies
     from honeybee.room import Room
@@ -45,14 +60,125 @@ except ImportError as e:
     raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
 
 try:  # import the ladybug_rhino dependencies
-    from ladybug_rhino.intersect import bounding_box, intersect_solids, \
-        intersect_solids_parallel
+    from ladybug_rhino.intersect import bounding_box, intersect_solid
     from ladybug_rhino.config import current_tolerance, angle_tolerance
     from ladybug_rhino.grasshopper import all_required_inputs, \
         recommended_processor_count, run_function_in_parallel
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.spatial import median_cell_size, bounding_box_grid
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
+
+def neighbor_indices(b_boxes, tolerance):
+    """Get the indices of objects with overlapping bounding boxes for each object.
+
+    The bounding boxes are placed once into a uniform 3D grid of cells, sized
+    by their median dimension, and each object is only compared against the
+    objects that share a grid cell with it. Objects that overlap more cells
+    than there are objects (eg. a large podium under many towers) are compared
+    against all other objects instead.
+
+    Args:
+        b_boxes: A list of bounding boxes where each box is a tuple with the
+            (x, y, z) tuples of the minimum and maximum bounding box vertices.
+        tolerance: The maximum distance at which bounding boxes are
+            considered overlapping.
+
+    Returns:
+        A tuple with one sorted tuple of neighbor indices for each bounding box.
+    """
+    def overlapping(i, j):
+        (min_1, max_1), (min_2, max_2) = b_boxes[i], b_boxes[j]
+        return all(mn_1 <= mx_2 + tolerance and mn_2 <= mx_1 + tolerance
+                   for mn_1, mx_1, mn_2, mx_2 in zip(min_1, max_1, min_2, max_2))
+
+    # place each bounding box into the cells of the grid that it overlaps
+    if len(b_boxes) == 0:
+        return ()
+    neighbors = [set() for _ in b_boxes]
+    cell_size = median_cell_size(b_boxes, tolerance)
+    grid, large_objs = bounding_box_grid(b_boxes, cell_size, tolerance, len(b_boxes))
+
+    # compare the objects that share a cell along with the large objects
+    for cell_objs in grid.values():
+        for count, i in enumerate(cell_objs):
+            for j in cell_objs[count + 1:]:
+                if j not in neighbors[i] and overlapping(i, j):
+                    neighbors[i].add(j)
+                    neighbors[j].add(i)
+    for i in large_objs:
+        for j in range(len(b_boxes)):
+            if j != i and j not in neighbors[i] and overlapping(i, j):
+                neighbors[i].add(j)
+                neighbors[j].add(i)
+    return tuple(tuple(sorted(nbrs)) for nbrs in neighbors)
+
+
+def run_by_cost(parallel_function, costs, cpu_count):
+    """Run a function over objects largest-cost-first with dynamic work stealing.
+
+    Rather than splitting the objects evenly by count, each worker repeatedly
+    takes the most expensive object that remains in a shared queue. So workers
+    that finish cheap objects keep stealing work instead of sitting idle while
+    another worker processes a group containing the largest objects.
+
+    Args:
+        parallel_function: A function with a single input argument for the
+            integer of the object to be processed.
+        costs: A list of numbers for the estimated cost of processing each object.
+        cpu_count: An integer for the number of CPUs to be used.
+    """
+    queue = sorted(range(len(costs)), key=lambda i: costs[i], reverse=True)
+    queue.reverse()  # pop from the end of the list to get the largest first
+    lock = threading.Lock()
+    worker_count = max(1, min(cpu_count, len(queue)))
+
+    def next_object():
+        with lock:
+            return queue.pop() if len(queue) != 0 else None
+
+    def run_worker(worker_i):
+        obj_i = next_object()
+        while obj_i is not None:
+            parallel_function(obj_i)
+            obj_i = next_object()
+
+    run_function_in_parallel(run_worker, worker_count, worker_count)
+
+
+def brep_key(brep):
+    """Get a key for the geometry of a Rhino Brep using its vertices and faces."""
+    verts = tuple((v.Location.X, v.Location.Y, v.Location.Z) for v in brep.Vertices)
+    return verts, brep.Faces.Count
+
+
+def dirty_indices(obj_keys, neighbors, cache):
+    """Get the indices of objects that must be intersected given a cache of results.
+
+    Args:
+        obj_keys: A list of cache keys for each object being intersected.
+        neighbors: A tuple with the neighbor indices of each object.
+        cache: A dictionary with object keys mapped to tuples of the split
+            geometry and the frozenset of neighbor keys it was split against.
+
+    Returns:
+        A list of indices for the objects that have changed or have a changed
+        set of neighbors since they were cached.
+    """
+    dirty = []
+    for i, (key, nbrs) in enumerate(zip(obj_keys, neighbors)):
+        try:
+            _, cached_nbrs = cache[key]
+        except KeyError:  # a new or changed object
+            dirty.append(i)
+            continue
+        if cached_nbrs != frozenset(obj_keys[j] for j in nbrs):
+            dirty.append(i)  # one of the neighbors is new or changed
+    return dirty
 
 
 if all_required_inputs(ghenv.Component) and _run:
@@ -60,23 +186,86 @@ if all_required_inputs(ghenv.Component) and _run:
     tolerance = current_tolerance()
     workers = _cpu_count_ if _cpu_count_ is not None else recommended_processor_count()
 
-    if isinstance(_rooms[0], Room):
+    cache_key = 'hb_intersect_solids_{}'.format(ghenv.Component.InstanceGuid)
+    cache = sc.sticky.get(cache_key, {}) if cache_ else {}
+
+    hb_rooms = isinstance(_rooms[0], Room)
+    if hb_rooms:
         # assume that all inputs are Honeybee Rooms
         int_rooms = [room.duplicate() for room in _rooms]
-        if workers <= 1:
-            Room.intersect_adjacency(int_rooms, tolerance, angle_tolerance)
-        else:
-            room_geos = [r.geometry for r in int_rooms]
-            def intersect_room(r_count):
-                rel_room = int_rooms[r_count]
-                other_rooms = room_geos[:r_count] + room_geos[r_count + 1:]
-                rel_room.coplanar_split(other_rooms, tolerance, angle_tolerance)
-                rel_room.remove_duplicate_faces(tolerance)
-            run_function_in_parallel(intersect_room, len(room_geos), workers)
+        room_geos = tuple(r.geometry for r in int_rooms)  # shared read-only store
+        b_boxes = [((g.min.x, g.min.y, g.min.z), (g.max.x, g.max.y, g.max.z))
+                   for g in room_geos]
+        obj_keys = [(r.identifier, r.geometry, tolerance, angle_tolerance)
+                    for r in int_rooms]
+        face_counts = [len(g.faces) for g in room_geos]
+
+        def intersect_obj(r_count):
+            rel_room = int_rooms[r_count]
+            try:  # re-split the Room with the geometry cached from a previous run
+                other_geos = cached_geos[r_count]
+            except KeyError:  # split the Room with the geometry of its neighbors
+                other_geos = [room_geos[j] for j in neighbors[r_count]]
+            rel_room.coplanar_split(other_geos, tolerance, angle_tolerance)
+            rel_room.remove_duplicate_faces(tolerance)
+
+        def split_geometry(r_count):
+            """Get the Face3Ds that were split out of the Faces of an input Room.
+
+            They are reversed such that re-splitting the input Room with them
+            numbers the new Faces in the same order as the original split.
+            """
+            input_ids = set(face.identifier for face in _rooms[r_count].faces)
+            return tuple(face.geometry for face in reversed(int_rooms[r_count].faces)
+                         if face.identifier not in input_ids)
     else:
         # assume that all inputs are closed Rhino Breps
+        int_rooms = _rooms[:]  # copy the input list to avoid editing it
         b_boxes = [bounding_box(brep) for brep in _rooms]
-        if workers > 1:
-            int_rooms = intersect_solids_parallel(_rooms, b_boxes, workers)
-        else:  # just use the single-core process
-            int_rooms = intersect_solids(_rooms, b_boxes)
+        b_boxes = [((bb.Min.X, bb.Min.Y, bb.Min.Z), (bb.Max.X, bb.Max.Y, bb.Max.Z))
+                   for bb in b_boxes]
+        obj_keys = [(brep_key(brep), tolerance, angle_tolerance) for brep in _rooms]
+        face_counts = [brep.Faces.Count for brep in _rooms]
+
+        def intersect_obj(b_count):
+            for j in neighbors[b_count]:  # split with the unchanged input Breps
+                split_brep, int_exists = \
+                    intersect_solid(int_rooms[b_count], _rooms[j])
+                if int_exists:
+                    int_rooms[b_count] = split_brep
+
+        def split_geometry(b_count):
+            """Get the split Brep, which has no properties other than its geometry."""
+            return int_rooms[b_count]
+
+    # figure out which objects have to be intersected
+    neighbors = neighbor_indices(b_boxes, tolerance)
+    to_run = dirty_indices(obj_keys, neighbors, cache)
+    dirty = set(to_run)
+    cached_geos = {i: cache[key][0] for i, key in enumerate(obj_keys) if i not in dirty}
+    if hb_rooms:  # re-split the Rooms that were split on the previous run
+        to_run.extend(i for i, geos in cached_geos.items() if len(geos) != 0)
+    else:  # the cached Breps are the split result
+        for i, split_brep in cached_geos.items():
+            int_rooms[i] = split_brep
+    if cache_:
+        print('{} of {} objects were re-used from the cache.'.format(
+            len(cached_geos), len(int_rooms)))
+
+    # intersect the objects with their neighbors or their cached geometry
+    if len(to_run) != 0:
+        costs = [face_counts[i] * len(cached_geos[i]) if i in cached_geos
+                 else face_counts[i] * len(neighbors[i]) for i in to_run]
+
+        def intersect_dirty_obj(count):
+            intersect_obj(to_run[count])
+        run_by_cost(intersect_dirty_obj, costs, workers)
+
+    # store the split geometry in the cache for the next run
+    if cache_:
+        sc.sticky[cache_key] = {
+            key: (split_geometry(i), frozenset(obj_keys[j] for j in neighbors[i]))
+            for i, key in enumerate(obj_keys)
+        }
+    elif cache_key in sc.sticky:
+        sc.sticky.pop(cache_key)
@@ -28,6 +28,12 @@ different faces and sub-faces.
         _font_: An optional name of a font in which the labels will display. This
             must be a font that is installed on this machine in order to work
             correctly. Default: "Arial".
+        _cpu_count_: An integer to set the number of CPUs used to compute the base
+            planes of the labels. The base planes are cached for each geometry
+            such that only the text is regenerated when the attribute, font or
+            text height changes. If unspecified, it will automatically default
+            to one less than the number of CPUs currently available on the
+            machine or 1 if only one processor is available.
 
     Returns:
         label_text: The text with which each of the faces or sub-faces are labeled.
@@ -45,32 +51,31 @@ ghenv.Component.Category = 'Honeybee'
 ghenv.Component.SubCategory = '1 :: Visualize'
 ghenv.Component.AdditionalHelpFromDocStrings = '4'
 
-import math
-
-try:  # import the ladybug_geometry dependencies
-    from ladybug_geometry.geometry3d.plane import Plane
-except ImportError as e:
-    raise ImportError('\nFailed to import ladybug_geometry:\n\t{}'.format(e))
-
 try:  # import the core honeybee dependencies
     from honeybee.model import Model
     from honeybee.room import Room
     from honeybee.face import Face
     from honeybee.aperture import Aperture
     from honeybee.door import Door
-    from honeybee.search import get_attr_nested
     from honeybee.units import parse_distance_string
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
 
 try:  # import the ladybug_rhino dependencies
     from ladybug_rhino.fromgeometry import from_face3d_to_wireframe, from_plane
-    from ladybug_rhino.text import text_objects
     from ladybug_rhino.config import current_tolerance, conversion_to_meters, units_system
-    from ladybug_rhino.grasshopper import all_required_inputs
+    from ladybug_rhino.grasshopper import all_required_inputs, \
+        recommended_processor_count
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.attribute import UNIT_SENSITIVE, \
+        attribute_values, rounded_value, unit_sensitive_values
+    from honeybee_grasshopper_core.label import face_anchor, label_anchors, \
+        label_object
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
 
 # hide the base_pts output from the scene
 ghenv.Component.Params.Output[1].Hidden = True
@@ -80,54 +85,27 @@ max_txt_h = 0.25 / conversion_to_meters()
 tolerance = current_tolerance()
 units = units_system()
 p_tol = parse_distance_string('0.01m', units)
-# dictionary of unit-sensitive propperties to be handled specially
-UNIT_SENSITIVE = {
-    'properties.energy.r_factor': 'R Factor',
-    'properties.energy.u_factor': 'U Factor',
-    'properties.energy.shgc': 'SHGC'
-}
 
 
-def label_face(face, _attribute_, _font_, label_text, base_pts, labels, wire_frame):
+def label_face(face, face_prop, anchor, _font_, label_text, base_pts, labels,
+               wire_frame):
     """Generate labels for a face or sub-face and add it to a list."""
-    if _attribute_ in UNIT_SENSITIVE:
-        obj_method = get_attr_nested(face, _attribute_, cast_to_str=False)
-        face_prop = str(obj_method(units))
-    else:
-        face_prop = str(get_attr_nested(face, _attribute_, 5))
-
     # get a base plane and text height for the text label
-    f_geo = face.geometry
-    cent_pt = f_geo.center if f_geo.is_convex else f_geo.pole_of_inaccessibility(p_tol)
-    base_plane = Plane(f_geo.normal, cent_pt)
-    if base_plane.y.z < 0:  # base plane pointing downwards; rotate it
-        base_plane = base_plane.rotate(base_plane.n, math.pi, base_plane.o)
+    base_plane, m_vec, dim = anchor
     if _txt_height_ is None:  # auto-calculate default text height
         txt_len = len(face_prop) if len(face_prop) > 10 else 10
-        dims = [
-            (f_geo.max.x - f_geo.min.x),
-            (f_geo.max.y - f_geo.min.y),
-            (f_geo.max.z - f_geo.min.z)]
-        dims.sort()
-        txt_h = dims[1] / txt_len
+        txt_h = dim / txt_len
     else:
         txt_h = _txt_height_
     if txt_h < tolerance:
         return
     txt_h = max_txt_h if txt_h > max_txt_h else txt_h
-    if base_plane.y.z < 0:  # base plane pointing downwards; rotate it
-        base_plane = base_plane.rotate(base_plane.n, math.pi, base_plane.o)
 
     # move base plane origin a little to avoid overlaps of adjacent labels
-    if base_plane.n.x != 0:
-        m_vec = base_plane.y if base_plane.n.x < 0 else -base_plane.y
-    else:
-        m_vec = base_plane.y if base_plane.n.z < 0 else -base_plane.y
     base_plane = base_plane.move(m_vec * txt_h)
 
     # create the text label
-    label = text_objects(face_prop, base_plane, txt_h, font=_font_,
-                         horizontal_alignment=1, vertical_alignment=3)
+    label = label_object(face_prop, base_plane, txt_h, _font_)
 
     # append everything to the lists
     label_text.append(face_prop)
@@ -149,63 +127,52 @@ if all_required_inputs(ghenv.Component):
     if _font_ is None:
         _font_ = 'Arial'
     
-    # generate the labels
+    # gather the faces or sub-faces to be labeled
+    faces = []
     if not sub_faces_:
         for obj in _hb_objs:
             if isinstance(obj, Room):
-                for face in obj.faces:
-                    label_face(face, _attribute_, _font_, label_text, base_pts,
-                               labels, wire_frame)
+                faces.extend(obj.faces)
             elif isinstance(obj, Face):
-                label_face(obj, _attribute_, _font_, label_text, base_pts,
-                           labels, wire_frame)
+                faces.append(obj)
             elif isinstance(obj, Model):
                 for room in obj.rooms:
-                    for face in room.faces:
-                        label_face(face, _attribute_, _font_, label_text, base_pts,
-                                   labels, wire_frame)
-                for face in obj.orphaned_faces:
-                    label_face(face, _attribute_, _font_, label_text, base_pts,
-                               labels, wire_frame)
+                    faces.extend(room.faces)
+                faces.extend(obj.orphaned_faces)
     else:
         for obj in _hb_objs:
             if isinstance(obj, Room):
                 for face in obj.faces:
-                    for ap in face.apertures:
-                        label_face(ap, _attribute_, _font_, label_text, base_pts,
-                                   labels, wire_frame)
-                    for dr in face.doors:
-                         label_face(dr, _attribute_, _font_, label_text, base_pts,
-                                    labels, wire_frame)
+                    faces.extend(face.apertures)
+                    faces.extend(face.doors)
             elif isinstance(obj, Face):
-                for ap in obj.apertures:
-                    label_face(ap, _attribute_, _font_, label_text, base_pts,
-                               labels, wire_frame)
-                for dr in obj.doors:
-                    label_face(dr, _attribute_, _font_, label_text, base_pts,
-                               labels, wire_frame)
+                faces.extend(obj.apertures)
+                faces.extend(obj.doors)
             elif isinstance(obj, (Aperture, Door)):
-                label_face(obj, _attribute_, _font_, label_text, base_pts,
-                          labels, wire_frame)
+                faces.append(obj)
             elif isinstance(obj, Model):
                 for room in obj.rooms:
                     for face in room.faces:
-                        for ap in face.apertures:
-                            label_face(ap, _attribute_, _font_, label_text, base_pts,
-                                       labels, wire_frame)
-                        for dr in face.doors:
-                             label_face(dr, _attribute_, _font_, label_text, base_pts,
-                                        labels, wire_frame)
+                        faces.extend(face.apertures)
+                        faces.extend(face.doors)
                 for face in obj.orphaned_faces:
-                    for ap in face.apertures:
-                        label_face(ap, _attribute_, _font_, label_text, base_pts,
-                                   labels, wire_frame)
-                    for dr in face.doors:
-                         label_face(dr, _attribute_, _font_, label_text, base_pts,
-                                    labels, wire_frame)
-                for ap in obj.orphaned_apertures:
-                    label_face(ap, _attribute_, _font_, label_text, base_pts,
-                               labels, wire_frame)
-                for dr in obj.orphaned_doors:
-                     label_face(dr, _attribute_, _font_, label_text, base_pts,
-                                labels, wire_frame)
\ No newline at end of file
+                    faces.extend(face.apertures)
+                    faces.extend(face.doors)
+                faces.extend(obj.orphaned_apertures)
+                faces.extend(obj.orphaned_doors)
+
+    # get the attributes of all faces in bulk
+    if _attribute_ in UNIT_SENSITIVE:
+        face_props = [str(val) for val in
+                      unit_sensitive_values(faces, _attribute_, units)]
+    else:
+        face_props = [str(rounded_value(val, 5))
+                      for val in attribute_values(faces, _attribute_)]
+
+    # get the anchors of the labels and generate the labels
+    workers = _cpu_count_ if _cpu_count_ is not None else recommended_processor_count()
+    anchors = label_anchors(
+        face_anchor, [(face.geometry, p_tol) for face in faces], workers)
+    for face, face_prop, anchor in zip(faces, face_props, anchors):
+        label_face(face, face_prop, anchor, _font_, label_text, base_pts,
+                   labels, wire_frame)
\ No newline at end of file
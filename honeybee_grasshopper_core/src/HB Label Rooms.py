@@ -28,6 +28,12 @@ different Rooms.
         _font_: An optional name of a font in which the labels will display. This
             must be a font that is installed on this machine in order to work
             correctly. Default: "Arial".
+        _cpu_count_: An integer to set the number of CPUs used to compute the base
+            planes of the labels. The base planes are cached for each Room
+            geometry such that only the text is regenerated when the attribute,
+            font or text height changes. If unspecified, it will automatically
+            default to one less than the number of CPUs currently available on
+            the machine or 1 if only one processor is available.
 
     Returns:
         label_text: The text with which each of the rooms are labeled.
@@ -46,42 +52,60 @@ ghenv.Component.SubCategory = '1 :: Visualize'
 ghenv.Component.AdditionalHelpFromDocStrings = '4'
 
 try:  # import the ladybug_geometry dependencies
-    from ladybug_geometry.geometry3d import Vector3D, Point3D, Polyline3D, \
-        Plane, Face3D, Polyface3D
+    from ladybug_geometry.geometry3d import Polyline3D
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_geometry:\n\t{}'.format(e))
 
 try:  # import the core honeybee dependencies
     from honeybee.model import Model
     from honeybee.facetype import Floor
-    from honeybee.search import get_attr_nested
     from honeybee.units import parse_distance_string
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
 
 try:  # import the ladybug_rhino dependencies
-    from ladybug_rhino.fromgeometry import from_polyface3d_to_wireframe, from_plane
-    from ladybug_rhino.text import text_objects
+    from ladybug_rhino.fromgeometry import from_linesegment3d, from_polyline3d, \
+        from_plane
     from ladybug_rhino.config import conversion_to_meters, units_system, current_tolerance
-    from ladybug_rhino.grasshopper import all_required_inputs
+    from ladybug_rhino.grasshopper import all_required_inputs, \
+        recommended_processor_count
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.visualize import welded_edges
+    from honeybee_grasshopper_core.attribute import attribute_values, \
+        rounded_value
+    from honeybee_grasshopper_core.label import room_anchor, label_anchors, \
+        label_object
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
 # hide the base_pts output from the scene
 ghenv.Component.Params.Output[1].Hidden = True
 # maximum text height in meters - converted to model units
 max_txt_h = 0.25 / conversion_to_meters()
 max_txt_v = 1.0 / conversion_to_meters()
 # tolerance for computing the pole of inaccessibility
+tolerance = current_tolerance()
 p_tol = parse_distance_string('0.01m', units_system())
 
 
+def room_anchors(rooms, cpu_count):
+    """Get the label anchors for a list of Rooms using the shared anchor cache."""
+    anchor_args = []
+    for room in rooms:
+        floors = tuple(face.geometry for face in room.faces
+                       if isinstance(face.type, Floor))
+        anchor_args.append((room.geometry, floors, tolerance, p_tol, max_txt_v))
+    return label_anchors(room_anchor, anchor_args, cpu_count)
+
+
 if all_required_inputs(ghenv.Component):
     # lists of rhino geometry to be filled with content
     label_text = []
     base_pts = []
     labels = []
-    wire_frame = []
 
     # set the default attribute and font
     if _attribute_ is None:
@@ -96,44 +120,32 @@ if all_required_inputs(ghenv.Component):
             rooms.extend(hb_obj.rooms)
         else:
             rooms.append(hb_obj)
-    tolerance = current_tolerance()
 
-    for room in rooms:
-        # get the attribute to be displayed
-        room_prop = str(get_attr_nested(room, _attribute_, 5))
-        # compute the center point for the text
-        room_h = room.geometry.max.z - room.geometry.min.z
-        m_vec = Vector3D(0, 0, max_txt_v) if room_h > max_txt_v * 2 \
-            else Vector3D(0, 0, room_h / 2)
-        floor_faces = [face.geometry for face in room.faces if isinstance(face.type, Floor)]
-        if len(floor_faces) == 1:
-            flr_geo = floor_faces[0]
-            base_pt = flr_geo.center if flr_geo.is_convex else \
-                flr_geo.pole_of_inaccessibility(p_tol)
-        elif len(floor_faces) == 0:
-            c_pt = room.geometry.center
-            base_pt = Point3D(c_pt.x, c_pt.y, room.geometry.min.z)
-        else:
-            floor_p_face = Polyface3D.from_faces(floor_faces, tolerance)
-            floor_outline = Polyline3D.join_segments(floor_p_face.naked_edges, tolerance)[0]
-            flr_geo = Face3D(floor_outline.vertices[:-1])
-            base_pt = flr_geo.center if flr_geo.is_convex else \
-                flr_geo.pole_of_inaccessibility(p_tol)
-        base_pt = base_pt.move(m_vec)
-        base_plane = Plane(Vector3D(0, 0, 1), base_pt)
+    # get the anchors of the labels
+    workers = _cpu_count_ if _cpu_count_ is not None else recommended_processor_count()
+    anchors = room_anchors(rooms, workers)
+
+    # get the attributes to be displayed for all rooms in bulk
+    room_props = [str(rounded_value(val, 5))
+                  for val in attribute_values(rooms, _attribute_)]
+
+    for room_prop, (base_plane, dim) in zip(room_props, anchors):
         # determine the text height
         if _txt_height_ is None:  # auto-calculate default text height
             txt_len = len(room_prop) if len(room_prop) > 10 else 10
-            txt_h = (room.geometry.max.x - room.geometry.min.x) / txt_len
+            txt_h = dim / txt_len
         else:
             txt_h = _txt_height_
         txt_h = max_txt_h if txt_h > max_txt_h else txt_h
         # create the text label
-        label = text_objects(room_prop, base_plane, txt_h, font=_font_,
-                             horizontal_alignment=1, vertical_alignment=3)
+        label = label_object(room_prop, base_plane, txt_h, _font_)
 
         # append everything to the lists
         label_text.append(room_prop)
         base_pts.append(from_plane(base_plane))
         labels.append(label)
-        wire_frame.extend(from_polyface3d_to_wireframe(room.geometry))
\ No newline at end of file
+
+    # weld the edges of all rooms into a wireframe without duplicated edges
+    wire_frame = [from_polyline3d(pl) if isinstance(pl, Polyline3D) else
+                  from_linesegment3d(pl) for pl in
+                  welded_edges([room.geometry for room in rooms], tolerance)]
\ No newline at end of file
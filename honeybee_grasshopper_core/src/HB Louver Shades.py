@@ -120,6 +120,11 @@ try:  # import the ladybug_rhino dependencies
     from ladybug_rhino.grasshopper import all_required_inputs, document_counter
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
+
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.lookup import lookup_by_identifier, track_solution
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
 tolerance = current_tolerance()
 
 
@@ -147,6 +152,9 @@ def assign_louvers(ap, depth, count, dist, off, angle, vec, flip, indr, ep, ep_t
 
 
 if all_required_inputs(ghenv.Component):
+    # share the library lookups with other components until the solution ends
+    track_solution(ghenv.Component)
+
     # duplicate the initial objects
     hb_objs = [obj.duplicate() for obj in _hb_objs]
 
@@ -174,13 +182,14 @@ if all_required_inputs(ghenv.Component):
     if len(ep_constr_) != 0:
         for i, constr in enumerate(ep_constr_):
             if isinstance(constr, str):
-                ep_constr_[i] = shade_construction_by_identifier(constr)
+                ep_constr_[i] = lookup_by_identifier(
+                    constr, shade_construction_by_identifier)
     else:
         ep_constr_ = [None]
     if len(ep_trans_sch_) != 0:
         for i, sch in enumerate(ep_trans_sch_):
             if isinstance(sch, str):
-                ep_trans_sch_[i] = schedule_by_identifier(sch)
+                ep_trans_sch_[i] = lookup_by_identifier(sch, schedule_by_identifier)
     else:
         ep_trans_sch_ = [None]
 
@@ -188,7 +197,7 @@ if all_required_inputs(ghenv.Component):
     if len(rad_mod_) != 0:
         for i, mod in enumerate(rad_mod_):
             if isinstance(mod, str):
-                rad_mod_[i] = modifier_by_identifier(mod)
+                rad_mod_[i] = lookup_by_identifier(mod, modifier_by_identifier)
     else:
         rad_mod_ = [None]
 
@@ -67,6 +67,11 @@ try:  # import the ladybug_rhino dependencies
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.guide import faces_by_guide_surface
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
 try:  # import the honeybee-energy extension
     from honeybee_energy.lib.constructions import opaque_construction_by_identifier
 except ImportError as e:
@@ -97,9 +102,8 @@ if all_required_inputs(ghenv.Component):
         rad_mod_ = modifier_by_identifier(rad_mod_)
 
     # loop through the rooms and set the face properties
-    for room in rooms:
-        select_faces = room.faces_by_guide_surface(
-            guide_faces, tolerance=tolerance, angle_tolerance=angle_tolerance)
+    for select_faces in faces_by_guide_surface(
+            rooms, guide_faces, tolerance, angle_tolerance):
         for hb_face in select_faces:
             if type_ is not None:
                 hb_face.type = type_
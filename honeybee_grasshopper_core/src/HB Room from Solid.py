@@ -49,6 +49,13 @@ avoid light leaks in Radiance simulations.
             indicates that all horizontal faces are walls. The default value
             of 60 degrees is the recommended value given by the ASHRAE 90.1
             standard. (Default: 60).
+        _cpu_count_: An integer to set the number of CPUs used to create the
+            Rooms and check that they are closed. The conversion of the Rhino
+            geometry always runs on a single thread but the construction and
+            checking of the Rooms from this geometry is run in parallel. If
+            unspecified, it will automatically default to one less than the
+            number of CPUs currently available on the machine or 1 if only one
+            processor is available.
 
     Returns:
         report: Reports, errors, warnings, etc.
@@ -74,10 +81,16 @@ try:  # import the ladybug_rhino dependencies
     from ladybug_rhino.config import current_tolerance
     from ladybug_rhino.togeometry import to_polyface3d
     from ladybug_rhino.grasshopper import all_required_inputs, give_warning, \
-        document_counter, longest_list
+        document_counter, longest_list, run_function_in_parallel, \
+        recommended_processor_count
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.lookup import lookup_by_identifier, track_solution
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
 try:  # import the honeybee-energy extension
     from honeybee_energy.lib.programtypes import program_type_by_identifier, \
         building_program_type_by_identifier, office_program
@@ -102,58 +115,71 @@ except ImportError as e:
 
 
 if all_required_inputs(ghenv.Component):
+    # share the library lookups with other components until the solution ends
+    track_solution(ghenv.Component)
+
     # set the default roof angle
     tolerance = current_tolerance()
     roof_angle = _roof_angle_ if _roof_angle_ is not None else 60
     floor_angle = 180 - roof_angle
 
-    rooms = []  # list of rooms that will be returned
-    for i, geo in enumerate(_geo):
-        # get the name for the Room
+    workers = _cpu_count_ if _cpu_count_ is not None else recommended_processor_count()
+
+    # get the names for the Rooms in order so that identifiers are deterministic
+    display_names = []
+    for i in range(len(_geo)):
         if len(_name_) == 0:  # make a default Room name
             display_name = 'Room_{}'.format(document_counter('room_count'))
         else:
             display_name = '{}_{}'.format(longest_list(_name_, i), i + 1) \
                 if len(_name_) != len(_geo) else longest_list(_name_, i)
-        name = clean_and_id_string(display_name)
+        display_names.append(display_name)
 
-        # create the Room
-        room = Room.from_polyface3d(
-            name, to_polyface3d(geo), roof_angle=roof_angle,
-            floor_angle=floor_angle, ground_depth=tolerance)
-        room.display_name = display_name
-
-        # check that the Room geometry is closed.
-        if room.check_solid(tolerance, raise_exception=False) != '':
-            msg = 'Input _geo is not a closed volume.\n' \
-                'Room volume must be closed to access most honeybee features.\n' \
-                'Preview the output Room to see the holes in your model.'
-            print(msg)
-            give_warning(ghenv.Component, msg)
+    # convert the Rhino geometry on the main thread
+    polyfaces = [to_polyface3d(geo) for geo in _geo]
 
-        # try to assign the modifier set
+    # look up any library objects on the main thread
+    mod_sets, constr_sets, programs = [], [], []
+    for i in range(len(_geo)):
         if len(_mod_set_) != 0:
             mod_set = longest_list(_mod_set_, i)
             if isinstance(mod_set, str):
-                mod_set = modifier_set_by_identifier(mod_set)
-            room.properties.radiance.modifier_set = mod_set
-
-        # try to assign the construction set
+                mod_set = lookup_by_identifier(mod_set, modifier_set_by_identifier)
+            mod_sets.append(mod_set)
         if len(_constr_set_) != 0:
             constr_set = longest_list(_constr_set_, i)
             if isinstance(constr_set, str):
-                constr_set = construction_set_by_identifier(constr_set)
-            room.properties.energy.construction_set = constr_set
-
-        # try to assign the program
+                constr_set = lookup_by_identifier(
+                    constr_set, construction_set_by_identifier)
+            constr_sets.append(constr_set)
         if len(_program_) != 0:
             program = longest_list(_program_, i)
             if isinstance(program, str):
-                try:
-                    program = building_program_type_by_identifier(program)
-                except ValueError:
-                    program = program_type_by_identifier(program)
-            room.properties.energy.program_type = program
+                program = lookup_by_identifier(
+                    program, building_program_type_by_identifier,
+                    program_type_by_identifier)
+            programs.append(program)
+
+    def create_room(i):
+        """Create a Room from a converted Polyface3D and assign its properties."""
+        # create the Room
+        display_name = display_names[i]
+        room = Room.from_polyface3d(
+            clean_and_id_string(display_name), polyfaces[i], roof_angle=roof_angle,
+            floor_angle=floor_angle, ground_depth=tolerance)
+        room.display_name = display_name
+
+        # try to assign the modifier set
+        if len(mod_sets) != 0:
+            room.properties.radiance.modifier_set = mod_sets[i]
+
+        # try to assign the construction set
+        if len(constr_sets) != 0:
+            room.properties.energy.construction_set = constr_sets[i]
+
+        # try to assign the program
+        if len(programs) != 0:
+            room.properties.energy.program_type = programs[i]
         else:  # generic office program by default
             try:
                 room.properties.energy.program_type = office_program
@@ -167,4 +193,28 @@ if all_required_inputs(ghenv.Component):
             except (NameError, AttributeError):
                 pass  # honeybee-energy is not installed
 
-        rooms.append(room)
\ No newline at end of file
+        rooms[i] = room
+
+    def check_room(i):
+        """Check whether a Room is a closed volume, noting the message if it is not."""
+        solid_msgs[i] = rooms[i].check_solid(tolerance, raise_exception=False)
+
+    # create the Rooms in parallel
+    rooms = [None] * len(_geo)  # list of rooms that will be returned
+    run_function_in_parallel(create_room, len(_geo), workers)
+
+    # check that the Room geometry is closed once all of the Rooms are created
+    solid_msgs = [''] * len(rooms)  # list of messages for rooms that are not closed
+    run_function_in_parallel(check_room, len(rooms), workers)
+
+    # give a single warning for all Room geometries that are not closed
+    open_rooms = [i for i, msg in enumerate(solid_msgs) if msg != '']
+    if len(open_rooms) != 0:
+        for i in open_rooms:
+            print(solid_msgs[i])
+        msg = '{} of the input _geo are not closed volumes. Their indices are:\n' \
+            '{}\nRoom volume must be closed to access most honeybee features.\n' \
+            'Preview the output Rooms to see the holes in your model.'.format(
+                len(open_rooms), ', '.join(str(i) for i in open_rooms))
+        print(msg)
+        give_warning(ghenv.Component, msg)
\ No newline at end of file
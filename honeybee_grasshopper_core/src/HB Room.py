@@ -69,6 +69,11 @@ try:  # import the ladybug_rhino dependencies
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.lookup import lookup_by_identifier, track_solution
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
 try:  # import the honeybee-energy extension
     from honeybee_energy.lib.programtypes import program_type_by_identifier, \
         building_program_type_by_identifier, office_program
@@ -94,6 +99,9 @@ tolerance = current_tolerance()
 
 
 if all_required_inputs(ghenv.Component):
+    # share the library lookups with other components until the solution ends
+    track_solution(ghenv.Component)
+
     # duplicate the input objects to avoid editing them
     faces = (face.duplicate() for face in _faces)
 
@@ -117,22 +125,22 @@ if all_required_inputs(ghenv.Component):
     # try to assign the modifier set
     if _mod_set_ is not None:
         if isinstance(_mod_set_, str):
-            _mod_set_ = modifier_set_by_identifier(_mod_set_)
+            _mod_set_ = lookup_by_identifier(_mod_set_, modifier_set_by_identifier)
         room.properties.radiance.modifier_set = _mod_set_
 
     # try to assign the construction set
     if _constr_set_ is not None:
         if isinstance(_constr_set_, str):
-            _constr_set_ = construction_set_by_identifier(_constr_set_)
+            _constr_set_ = lookup_by_identifier(
+                _constr_set_, construction_set_by_identifier)
         room.properties.energy.construction_set = _constr_set_
 
     # try to assign the program
     if _program_ is not None:
         if isinstance(_program_, str):
-            try:
-                _program_ = building_program_type_by_identifier(_program_)
-            except ValueError:
-                _program_ = program_type_by_identifier(_program_)
+            _program_ = lookup_by_identifier(
+                _program_, building_program_type_by_identifier,
+                program_type_by_identifier)
         room.properties.energy.program_type = _program_
     else:  # generic office program by default
         try:
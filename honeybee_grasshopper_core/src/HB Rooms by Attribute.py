@@ -61,10 +61,16 @@ try:  # import the ladybug_rhino dependencies
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.attribute import attribute_values, \
+        display_attributes
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
 
 if all_required_inputs(ghenv.Component):
     # extract any rooms from input Models
-    in_rooms, ColorClass = [], ColorRoom
+    in_rooms, ColorClass = [], None
     for hb_obj in _rooms:
         if isinstance(hb_obj, Room):
             in_rooms.append(hb_obj)
@@ -76,26 +82,31 @@ if all_required_inputs(ghenv.Component):
         else:
             raise TypeError('Expected Room or Model. Got {}.'.format(type(hb_obj)))
 
-    # use the ColorRoom object to get a set of attributes assigned to the rooms
-    color_obj = ColorClass(in_rooms, _attribute)
+    # get the attributes assigned to the rooms
+    if ColorClass is None:
+        attributes, attributes_unique = \
+            display_attributes(attribute_values(in_rooms, _attribute))
+    else:  # use the ColorRoom2D object to get the attributes of the Room2Ds
+        color_obj = ColorClass(in_rooms, _attribute)
+        attributes, attributes_unique = color_obj.attributes, color_obj.attributes_unique
 
     # loop through each of the rooms and get the attributes
     if len(value_) == 0:
-        values = color_obj.attributes_unique
+        values = attributes_unique
+        value_i = {val: i for i, val in enumerate(values)}
         rooms = [[] for val in values]
-        for atr, room in zip(color_obj.attributes, in_rooms):
-            atr_i = values.index(atr)
-            rooms[atr_i].append(room)
+        for atr, room in zip(attributes, in_rooms):
+            rooms[value_i[atr]].append(room)
     else:
         values = []
-        for unique_atr in color_obj.attributes_unique:
+        for unique_atr in attributes_unique:
             for kw in value_:
                 if kw.lower() in str(unique_atr).lower():
                     values.append(unique_atr)
                     break 
+        value_i = {val: i for i, val in enumerate(values)}
         rooms = [[] for val in values]
-        for atr, room in zip(color_obj.attributes, in_rooms):
-            if atr in values:
-                atr_i = values.index(atr)
-                rooms[atr_i].append(room)
+        for atr, room in zip(attributes, in_rooms):
+            if atr in value_i:
+                rooms[value_i[atr]].append(room)
     rooms = list_to_data_tree(rooms)
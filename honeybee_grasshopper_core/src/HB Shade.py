@@ -52,6 +52,11 @@ try:  # import the ladybug_geometry dependencies
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.lookup import lookup_by_identifier, track_solution
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
 try:  # import the core honeybee dependencies
     from honeybee.shade import Shade
     from honeybee.shademesh import ShadeMesh
@@ -94,6 +99,9 @@ except ImportError:
 
 
 if all_required_inputs(ghenv.Component):
+    # share the library lookups with other components until the solution ends
+    track_solution(ghenv.Component)
+
     shades = []  # list of shades that will be returned
     for j, geo in enumerate(_geo):
         if len(_name_) == 0:  # make a default Shade name
@@ -116,21 +124,23 @@ if all_required_inputs(ghenv.Component):
             if len(ep_constr_) != 0:
                 ep_constr = longest_list(ep_constr_, j)
                 if isinstance(ep_constr, str):
-                    ep_constr = shade_construction_by_identifier(ep_constr)
+                    ep_constr = lookup_by_identifier(
+                        ep_constr, shade_construction_by_identifier)
                 hb_shd.properties.energy.construction = ep_constr
 
             # try to assign the energyplus transmittance schedule
             if len(ep_trans_sch_) != 0:
                 ep_trans_sch = longest_list(ep_trans_sch_, j)
                 if isinstance(ep_trans_sch, str):
-                    ep_trans_sch = schedule_by_identifier(ep_trans_sch)
+                    ep_trans_sch = lookup_by_identifier(
+                        ep_trans_sch, schedule_by_identifier)
                 hb_shd.properties.energy.transmittance_schedule = ep_trans_sch
 
             # try to assign the radiance modifier
             if len(rad_mod_) != 0:
                 rad_mod = longest_list(rad_mod_, j)
                 if isinstance(rad_mod, str):
-                    rad_mod = modifier_by_identifier(rad_mod)
+                    rad_mod = lookup_by_identifier(rad_mod, modifier_by_identifier)
                 hb_shd.properties.radiance.modifier = rad_mod
 
             shades.append(hb_shd)  # collect the final Shades
@@ -89,102 +89,131 @@ except ImportError as e:
                          'has failed to import.\n{}'.format(e))
 
 
-def reversed_opaque_constr(construction):
-    """Get a version of a given OpaqueConstruction that is reversed."""
-    if construction.is_symmetric:
-        return construction
-    return OpaqueConstruction('{}_Rev'.format(construction.identifier),
-                              [mat for mat in reversed(construction.materials)])
+# map between the Face types that can be assigned by a subset and their index
+FACE_TYPE_INDEX = {Wall: 0, RoofCeiling: 1, Floor: 2}
+
 
+def reversed_constr(construction, rev_constrs):
+    """Get a version of a given construction that is reversed.
 
-def reversed_window_constr(construction):
-    """Get a version of a given WindowConstruction that is reversed."""
+    Args:
+        construction: An OpaqueConstruction or WindowConstruction to be reversed.
+        rev_constrs: A dictionary of reversed constructions that have already
+            been created, with identifiers of the original constructions as keys.
+            This ensures only one reversed construction exists per identifier.
+    """
     if construction.is_symmetric:
         return construction
-    return WindowConstruction('{}_Rev'.format(construction.identifier),
-                              [mat for mat in reversed(construction.materials)])
+    try:
+        return rev_constrs[construction.identifier]
+    except KeyError:
+        constr_class = WindowConstruction \
+            if isinstance(construction, WindowConstruction) else OpaqueConstruction
+        rev_constr = constr_class('{}_Rev'.format(construction.identifier),
+                                  [mat for mat in reversed(construction.materials)])
+        rev_constrs[construction.identifier] = rev_constr
+        return rev_constr
+
 
+def bucket_adj_info(adj_info):
+    """Group the adjacent objects by type in a single pass over the adjacency info.
 
-def apply_constr_to_face(adjacent_faces, construction, face_type):
-    """Apply a given construction to adjacent faces of a certain type."""
-    rev_constr = reversed_opaque_constr(construction)
-    for face_pair in adjacent_faces:
-        if isinstance(face_pair[0].type, face_type):
-            face_pair[0].properties.energy.construction = construction
-            face_pair[1].properties.energy.construction = rev_constr
-        elif isinstance(face_pair[1].type, face_type):
-            face_pair[1].properties.energy.construction = construction
-            face_pair[0].properties.energy.construction = rev_constr
+    Returns:
+        A tuple with two items.
 
+        -   face_buckets: A dictionary of adjacent Face pairs where the keys are
+            tuples with the subset index of each Face's type (None for types
+            not in the subset, like AirBoundary).
 
-def apply_constr_to_door(adjacent_doors, construction, is_glass):
-    """Apply a given construction to adjacent doors of a certain type."""
-    rev_constr = reversed_window_constr(construction) if is_glass else \
-        reversed_opaque_constr(construction)
-    for dr_pair in adjacent_doors:
-        if dr_pair[0].is_glass is is_glass:
-            dr_pair[1].properties.energy.construction = construction
-            dr_pair[0].properties.energy.construction = rev_constr
+        -   door_buckets: A tuple with two lists of adjacent Door pairs. The first
+            list contains the opaque doors and the second contains glass doors.
+    """
+    face_buckets = {}
+    for face_pair in adj_info['adjacent_faces']:
+        key = (FACE_TYPE_INDEX.get(type(face_pair[0].type)),
+               FACE_TYPE_INDEX.get(type(face_pair[1].type)))
+        try:
+            face_buckets[key].append(face_pair)
+        except KeyError:
+            face_buckets[key] = [face_pair]
+    door_buckets = ([], [])
+    for dr_pair in adj_info['adjacent_doors']:
+        door_buckets[int(dr_pair[0].is_glass)].append(dr_pair)
+    return face_buckets, door_buckets
+
+
+def face_bucket_slot(bucket_key, subset):
+    """Get the subset index governing a bucket of Face pairs and its orientation.
+
+    The result matches assigning the Wall, RoofCeiling and Floor items of the
+    subset in order, such that the last matching item wins and the first Face
+    of the pair takes precedence when both Faces match the same item.
+
+    Returns:
+        A tuple with the subset index (None if no item applies) and a boolean
+        noting whether the second Face of the pair is the one that matched.
+    """
+    slots = [i if i is not None and subset[i] is not None else -1
+             for i in bucket_key]
+    if slots[0] == slots[1] == -1:
+        return None, False
+    if slots[0] >= slots[1]:
+        return slots[0], False
+    return slots[1], True
 
 
-def apply_ep_int_constr(adj_info, ep_int_constr):
+def apply_ep_int_constr(adj_info, ep_int_constr, buckets):
     """Apply the interior construction subset list to adjacent objects."""
     assert len(ep_int_constr) == 6, 'Input ep_int_constr_ is not valid.'
-    
-    if ep_int_constr[0] is not None:
-        apply_constr_to_face(adj_info['adjacent_faces'], ep_int_constr[0], Wall)
-    if ep_int_constr[1] is not None:
-        apply_constr_to_face(adj_info['adjacent_faces'], ep_int_constr[1], RoofCeiling)
-    if ep_int_constr[2] is not None:
-        apply_constr_to_face(adj_info['adjacent_faces'], ep_int_constr[2], Floor)
+    face_buckets, door_buckets = buckets
+    rev_constrs = {}
+
+    for bucket_key, face_pairs in face_buckets.items():
+        slot, flip = face_bucket_slot(bucket_key, ep_int_constr)
+        if slot is None:
+            continue
+        constr = ep_int_constr[slot]
+        rev_constr = reversed_constr(constr, rev_constrs)
+        f_i, r_i = (1, 0) if flip else (0, 1)
+        for face_pair in face_pairs:
+            face_pair[f_i].properties.energy.construction = constr
+            face_pair[r_i].properties.energy.construction = rev_constr
+
     if ep_int_constr[3] is not None:
-        rev_constr = reversed_window_constr(ep_int_constr[3])
+        rev_constr = reversed_constr(ep_int_constr[3], rev_constrs)
         for ap_pair in adj_info['adjacent_apertures']:
             ap_pair[1].properties.energy.construction = ep_int_constr[3]
             ap_pair[0].properties.energy.construction = rev_constr
-    if ep_int_constr[4] is not None:
-        apply_constr_to_door(adj_info['adjacent_doors'], ep_int_constr[4], False)
-    if ep_int_constr[5] is not None:
-        apply_constr_to_door(adj_info['adjacent_doors'], ep_int_constr[5], True)
-
-
-def apply_mod_to_face(adjacent_faces, modifier, face_type):
-    """Apply a given modifier to adjacent faces of a certain type."""
-    for face_pair in adjacent_faces:
-        if isinstance(face_pair[0].type, face_type):
-            face_pair[0].properties.radiance.modifier = modifier
-            face_pair[1].properties.radiance.modifier = modifier
-        elif isinstance(face_pair[1].type, face_type):
-            face_pair[1].properties.radiance.modifier = modifier
-            face_pair[0].properties.radiance.modifier = modifier
-
+    for constr, dr_pairs in zip(ep_int_constr[4:], door_buckets):
+        if constr is not None:
+            rev_constr = reversed_constr(constr, rev_constrs)
+            for dr_pair in dr_pairs:
+                dr_pair[1].properties.energy.construction = constr
+                dr_pair[0].properties.energy.construction = rev_constr
 
-def apply_mod_to_door(adjacent_doors, modifier, is_glass):
-    """Apply a given modifier to adjacent doors of a certain type."""
-    for dr_pair in adjacent_doors:
-        if dr_pair[0].is_glass is is_glass:
-            dr_pair[1].properties.radiance.modifier = modifier
-            dr_pair[0].properties.radiance.modifier = modifier
 
-
-def apply_rad_int_mod(adj_info, rad_int_mod):
+def apply_rad_int_mod(adj_info, rad_int_mod, buckets):
     """Apply the interior modifier subset list to adjacent objects."""
     assert len(rad_int_mod) == 6, 'Input rad_int_mod_ is not valid.'
-    
-    if rad_int_mod[0] is not None:
-        apply_mod_to_face(adj_info['adjacent_faces'], rad_int_mod[0], Wall)
-    if rad_int_mod[1] is not None:
-        apply_mod_to_face(adj_info['adjacent_faces'], rad_int_mod[1], RoofCeiling)
-    if rad_int_mod[2] is not None:
-        apply_mod_to_face(adj_info['adjacent_faces'], rad_int_mod[2], Floor)
+    face_buckets, door_buckets = buckets
+
+    for bucket_key, face_pairs in face_buckets.items():
+        slot, _ = face_bucket_slot(bucket_key, rad_int_mod)
+        if slot is None:
+            continue
+        for face_pair in face_pairs:
+            face_pair[0].properties.radiance.modifier = rad_int_mod[slot]
+            face_pair[1].properties.radiance.modifier = rad_int_mod[slot]
+
     if rad_int_mod[3] is not None:
         for ap_pair in adj_info['adjacent_apertures']:
             ap_pair[1].properties.radiance.modifier = rad_int_mod[3]
             ap_pair[0].properties.radiance.modifier = rad_int_mod[3]
-    if rad_int_mod[4] is not None:
-        apply_mod_to_door(adj_info['adjacent_doors'], rad_int_mod[4], False)
-    if rad_int_mod[5] is not None:
-        apply_mod_to_door(adj_info['adjacent_doors'], rad_int_mod[5], True)
+    for modifier, dr_pairs in zip(rad_int_mod[4:], door_buckets):
+        if modifier is not None:
+            for dr_pair in dr_pairs:
+                dr_pair[1].properties.radiance.modifier = modifier
+                dr_pair[0].properties.radiance.modifier = modifier
 
 
 if all_required_inputs(ghenv.Component) and _run:
@@ -208,13 +237,17 @@ if all_required_inputs(ghenv.Component) and _run:
     else:  # just solve for new adjacencies
         adj_info = Room.solve_adjacency(adj_rooms, tolerance)
 
+    # group the adjacent objects by type once if subsets are to be assigned
+    if len(ep_int_constr_) != 0 or len(rad_int_mod_) != 0:
+        buckets = bucket_adj_info(adj_info)
+
     # try to assign the energyplus constructions if specified
     if len(ep_int_constr_) != 0:
-        apply_ep_int_constr(adj_info, ep_int_constr_)
+        apply_ep_int_constr(adj_info, ep_int_constr_, buckets)
 
     # try to assign the radiance modifiers if specified
     if len(rad_int_mod_) != 0:
-        apply_rad_int_mod(adj_info, rad_int_mod_)
+        apply_rad_int_mod(adj_info, rad_int_mod_, buckets)
 
     # try to assign the adiabatic boundary condition
     if adiabatic_:
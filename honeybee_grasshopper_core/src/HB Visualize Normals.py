@@ -16,6 +16,11 @@ geometry object the Rhino scene, including all sub-faces and assigned shades.
         _hb_objs: A Honeybee Model, Room, Face, Shade, Aperture, or Door for which
             points and vectors will be output in the Rhino scene to show the
             object's orientation.
+        _cpu_count_: An integer to set the number of CPUs used to compute the
+            points on non-convex geometries, which is the slowest part of the
+            calculation. If unspecified, it will automatically default to one
+            less than the number of CPUs currently available on the machine or
+            1 if only one processor is available.
 
     Returns:
         points: Points that lie at the center of each surface of the connected _hb_objs.
@@ -33,6 +38,11 @@ ghenv.Component.Category = 'Honeybee'
 ghenv.Component.SubCategory = '1 :: Visualize'
 ghenv.Component.AdditionalHelpFromDocStrings = '1'
 
+try:  # import the ladybug_geometry dependencies
+    from ladybug_geometry.geometry3d import Mesh3D
+except ImportError as e:
+    raise ImportError('\nFailed to import ladybug_geometry:\n\t{}'.format(e))
+
 try:  # import the core honeybee dependencies
     from honeybee.model import Model
     from honeybee.room import Room
@@ -48,99 +58,95 @@ except ImportError as e:
 try:  # import the ladybug_rhino dependencies
     from ladybug_rhino.config import units_system
     from ladybug_rhino.fromgeometry import from_point3d, from_vector3d
-    from ladybug_rhino.grasshopper import all_required_inputs
+    from ladybug_rhino.grasshopper import all_required_inputs, \
+        recommended_processor_count
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.visualize import points_on_faces
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
 
 # tolerance for computing the pole of inaccessibility
 p_tol = parse_distance_string('0.01m', units_system())
 
 
-def point_on_face(f_geo):
-    """Get a point that lies on a Face3D."""
-    return f_geo.center if f_geo.is_convex else f_geo.pole_of_inaccessibility(p_tol)
+def add_door(door, geos):
+    """Add Door geometries."""
+    geos.append(door.geometry)
+    geos.extend(shd.geometry for shd in door.shades)
 
+def add_aperture(aperture, geos):
+    """Add Aperture geometries."""
+    geos.append(aperture.geometry)
+    geos.extend(shd.geometry for shd in aperture.shades)
 
-def add_door(door, points, vectors):
-    """Add Door normals."""
-    points.append(from_point3d(point_on_face(door.geometry)))
-    vectors.append(from_vector3d(door.normal))
-    for shd in door.shades:
-        points.append(from_point3d(point_on_face(shd.geometry)))
-        vectors.append(from_vector3d(shd.normal))
-
-def add_aperture(aperture, points, vectors):
-    """Add Aperture normals."""
-    points.append(from_point3d(point_on_face(aperture.geometry)))
-    vectors.append(from_vector3d(aperture.normal))
-    for shd in aperture.shades:
-        points.append(from_point3d(point_on_face(shd.geometry)))
-        vectors.append(from_vector3d(shd.normal))
-
-def add_face(face, points, vectors):
-    """Add Face normals."""
-    points.append(from_point3d(point_on_face(face.geometry)))
-    vectors.append(from_vector3d(face.normal))
+def add_face(face, geos):
+    """Add Face geometries."""
+    geos.append(face.geometry)
     for ap in face.apertures:
-        add_aperture(ap, points, vectors)
+        add_aperture(ap, geos)
     for dr in face.doors:
-        add_door(dr, points, vectors)
-    for shd in face.shades:
-        points.append(from_point3d(point_on_face(shd.geometry)))
-        vectors.append(from_vector3d(shd.normal))
+        add_door(dr, geos)
+    geos.extend(shd.geometry for shd in face.shades)
 
-def add_room(room, points, vectors):
-    """Add Room normals."""
+def add_room(room, geos):
+    """Add Room geometries."""
     for face in room.faces:
-        add_face(face, points, vectors)
-    for shd in room.shades:
-        points.append(from_point3d(point_on_face(shd.geometry)))
-        vectors.append(from_vector3d(shd.normal))
+        add_face(face, geos)
+    geos.extend(shd.geometry for shd in room.shades)
 
-def add_model(model, points, vectors):
-    """Add Model normals."""
+def add_model(model, geos):
+    """Add Model geometries."""
     for room in model.rooms:
-        add_room(room, points, vectors)
+        add_room(room, geos)
     for face in model.orphaned_faces:
-        add_face(face, points, vectors)
+        add_face(face, geos)
     for ap in model.orphaned_apertures:
-        add_aperture(ap, points, vectors)
+        add_aperture(ap, geos)
     for dr in model.orphaned_doors:
-        add_door(door, points, vectors)
-    for shd in model.orphaned_shades:
-        points.append(from_point3d(point_on_face(shd.geometry)))
-        vectors.append(from_vector3d(shd.normal))
-    for sm in model.shade_meshes:
-        for pt, norm in zip(sm.geometry.face_centroids, sm.geometry.face_normals):
-            points.append(from_point3d(pt))
-            vectors.append(from_vector3d(norm))
+        add_door(dr, geos)
+    geos.extend(shd.geometry for shd in model.orphaned_shades)
+    geos.extend(sm.geometry for sm in model.shade_meshes)
 
 
 if all_required_inputs(ghenv.Component):
-    # list of rhino geometry to be filled with content
-    points = []
-    vectors = []
+    # list of ladybug geometry to be filled with content
+    geos = []
 
     # loop through all objects and add them
     for hb_obj in _hb_objs:
         if isinstance(hb_obj, Room):
-            add_room(hb_obj, points, vectors)
+            add_room(hb_obj, geos)
         elif isinstance(hb_obj, Face):
-            add_face(hb_obj, points, vectors)
+            add_face(hb_obj, geos)
         elif isinstance(hb_obj, Aperture):
-            add_aperture(hb_obj, points, vectors)
+            add_aperture(hb_obj, geos)
         elif isinstance(hb_obj, Door):
-            add_door(hb_obj, points, vectors)
+            add_door(hb_obj, geos)
         elif isinstance(hb_obj, Shade):
-            points.append(from_point3d(hb_obj.center))
-            vectors.append(from_vector3d(hb_obj.normal))
+            geos.append(hb_obj.geometry)
         elif isinstance(hb_obj, ShadeMesh):
-            for pt, norm in zip(hb_obj.geometry.face_centroids, hb_obj.geometry.face_normals):
-                points.append(from_point3d(pt))
-                vectors.append(from_vector3d(norm))
+            geos.append(hb_obj.geometry)
         elif isinstance(hb_obj, Model):
-            add_model(hb_obj, points, vectors)
+            add_model(hb_obj, geos)
         else:
             raise TypeError(
                 'Unrecognized honeybee object type: {}'.format(type(hb_obj)))
+
+    # compute the points on all of the Face3Ds in bulk
+    workers = _cpu_count_ if _cpu_count_ is not None else recommended_processor_count()
+    face_geos = [geo for geo in geos if not isinstance(geo, Mesh3D)]
+    face_pts = iter(points_on_faces(face_geos, p_tol, workers))
+
+    # translate the points and vectors to Rhino
+    points, vectors = [], []
+    for geo in geos:
+        if isinstance(geo, Mesh3D):
+            points.extend(from_point3d(pt) for pt in geo.face_centroids)
+            vectors.extend(from_vector3d(vec) for vec in geo.face_normals)
+        else:
+            points.append(from_point3d(next(face_pts)))
+            vectors.append(from_vector3d(geo.normal))
\ No newline at end of file
@@ -18,6 +18,18 @@ assignment of child objects.
     Args:
         _hb_objs: A Honeybee Model, Room, Face, Shade, Aperture, or Door to be previewed
             in the Rhino scene.
+        lod_budget_: An optional integer for the target number of triangles in
+            the preview, which can be used to keep the Rhino viewport responsive
+            for large models. When the full-detail preview is over this budget,
+            the Rooms are collapsed to an extrusion of their floor and then to
+            their bounding box until they fit within it. Other objects are then
+            added from the largest to the smallest until the budget is used up.
+            If unspecified, all geometry will be previewed in full detail.
+        merge_: Boolean to note whether all of the geometry of each input Model
+            should be merged into a single Rhino mesh, which is much faster to
+            generate and display than a separate Brep for each object. All
+            other input objects (and all geometry simplified with the
+            lod_budget_) will be merged into one mesh. (Default: False).
 
     Returns:
         geo: The Rhino version of the Honeybee geometry object, which will be
@@ -31,45 +43,107 @@ ghenv.Component.Category = 'Honeybee'
 ghenv.Component.SubCategory = '1 :: Visualize'
 ghenv.Component.AdditionalHelpFromDocStrings = "1"
 
+try:  # import the ladybug_geometry dependencies
+    from ladybug_geometry.geometry3d import Polyface3D, Mesh3D
+except ImportError as e:
+    raise ImportError('\nFailed to import ladybug_geometry:\n\t{}'.format(e))
+
 try:  # import the core honeybee dependencies
     from honeybee.face import Face
     from honeybee.room import Room
     from honeybee.model import Model
-    from honeybee.shademesh import ShadeMesh
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
 
 try:  # import the core ladybug_rhino dependencies
     from ladybug_rhino.fromgeometry import from_face3d, from_polyface3d, from_mesh3d
+    from ladybug_rhino.config import current_tolerance
     from ladybug_rhino.grasshopper import all_required_inputs
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.visualize import triangulated_mesh3d, \
+        punched_geometry, lod_geometry
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+tolerance = current_tolerance()
+
+
+def object_geometry(hb_obj):
+    """Get a list of ladybug geometry to preview a Honeybee object."""
+    if isinstance(hb_obj, Face):
+        return [punched_geometry(hb_obj)]
+    elif isinstance(hb_obj, Room):
+        return [hb_obj.geometry]
+    elif isinstance(hb_obj, Model):
+        return [room.geometry for room in hb_obj.rooms] + \
+            [punched_geometry(face) for face in hb_obj.orphaned_faces] + \
+            [ap.geometry for ap in hb_obj.orphaned_apertures] + \
+            [dr.geometry for dr in hb_obj.orphaned_doors] + \
+            [shd.geometry for shd in hb_obj.orphaned_shades] + \
+            [sm.geometry for sm in hb_obj.shade_meshes]
+    return [hb_obj.geometry]  # Aperture, Door, Shade or ShadeMesh
+
+
+def to_rhino(geo):
+    """Get Rhino geometry from a ladybug Face3D, Polyface3D or Mesh3D."""
+    if isinstance(geo, Polyface3D):
+        return from_polyface3d(geo)
+    elif isinstance(geo, Mesh3D):
+        return from_mesh3d(geo)
+    return from_face3d(geo)
+
+
+def merged_mesh(geos):
+    """Get a single Rhino mesh from a list of ladybug geometries.
+
+    All of the geometry is triangulated with the shared triangulation cache
+    and added to one list of vertices and one list of faces so that only one
+    Rhino mesh is created.
+
+    Args:
+        geos: A list of ladybug_geometry Face3D, Polyface3D and Mesh3D.
+
+    Returns:
+        A Rhino mesh or None if none of the geometry could be triangulated.
+    """
+    verts, faces = [], []
+    for geo in geos:
+        if isinstance(geo, Mesh3D):
+            meshes = [geo]
+        else:
+            f_geos = geo.faces if isinstance(geo, Polyface3D) else (geo,)
+            meshes = [triangulated_mesh3d(None, f_geo) for f_geo in f_geos]
+        for mesh in meshes:
+            if mesh is None:
+                continue  # failed to triangulate the Face3D
+            st = len(verts)
+            verts.extend(mesh.vertices)
+            faces.extend(tuple(st + i for i in f) for f in mesh.faces)
+    return from_mesh3d(Mesh3D(verts, faces)) if len(faces) != 0 else None
+
 
 if all_required_inputs(ghenv.Component):
-    # lists of rhino geometry to be filled with content
-    geo = []
-
-    # loop through all objects and add them
-    for hb_obj in _hb_objs:
-        if isinstance(hb_obj, Face):
-            geo.append(from_face3d(hb_obj.punched_geometry))
-        elif isinstance(hb_obj, Room):
-            geo.append(from_polyface3d(hb_obj.geometry))
-        elif isinstance(hb_obj, Model):
-            for room in hb_obj.rooms:
-                geo.append(from_polyface3d(room.geometry))
-            for face in hb_obj.orphaned_faces:
-                geo.append(from_face3d(face.punched_geometry))
-            for ap in hb_obj.orphaned_apertures:
-                geo.append(from_face3d(ap.geometry))
-            for dr in hb_obj.orphaned_doors:
-                geo.append(from_face3d(dr.geometry))
-            for shd in hb_obj.orphaned_shades:
-                geo.append(from_face3d(shd.geometry))
-            for sm in hb_obj.shade_meshes:
-                geo.append(from_mesh3d(sm.geometry))
-        elif isinstance(hb_obj, ShadeMesh):
-            geo.append(from_mesh3d(hb_obj.geometry))
+    # get simplified geometry if the full-detail preview is over the budget
+    lod_geo = lod_geometry(_hb_objs, lod_budget_, tolerance, False) \
+        if lod_budget_ is not None else None
+
+    if not merge_:  # translate each object to Rhino geometry
+        lb_geo = lod_geo if lod_geo is not None else \
+            [g for hb_obj in _hb_objs for g in object_geometry(hb_obj)]
+        geo = [to_rhino(g) for g in lb_geo]
+    else:  # merge the geometry of each Model into a single mesh
+        if lod_geo is not None:
+            groups = [lod_geo]
         else:
-            geo.append(from_face3d(hb_obj.geometry))
+            groups, other_geo = [], []
+            for hb_obj in _hb_objs:
+                if isinstance(hb_obj, Model):
+                    groups.append(object_geometry(hb_obj))
+                else:
+                    other_geo.extend(object_geometry(hb_obj))
+            if len(other_geo) != 0:
+                groups.append(other_geo)
+        geo = [merged_mesh(lb_geo) for lb_geo in groups]
+        geo = [mesh for mesh in geo if mesh is not None]
\ No newline at end of file
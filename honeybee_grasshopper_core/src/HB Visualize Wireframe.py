@@ -15,6 +15,14 @@ scene, including all sub-faces and assigned shades.
     Args:
         _hb_objs: A Honeybee Model, Room, Face, Shade, Aperture, or Door to be previewed
             as a wire frame in the Rhino scene.
+        lod_budget_: An optional integer for the target number of triangles in
+            the preview, which can be used to keep the Rhino viewport responsive
+            for large models. When the full-detail preview is over this budget,
+            the Rooms are collapsed to an extrusion of their floor and then to
+            their bounding box until they fit within it. Sub-faces, shades and
+            other objects are then added from the largest to the smallest until
+            the budget is used up. If unspecified, all geometry will be
+            previewed in full detail.
     
     Returns:
         geo: The Rhino wireframe version of the Honeybee geometry object, which
@@ -28,12 +36,40 @@ ghenv.Component.Category = 'Honeybee'
 ghenv.Component.SubCategory = '1 :: Visualize'
 ghenv.Component.AdditionalHelpFromDocStrings = '1'
 
+try:  # import the ladybug_geometry dependencies
+    from ladybug_geometry.geometry3d import Polyface3D, Mesh3D
+except ImportError as e:
+    raise ImportError('\nFailed to import ladybug_geometry:\n\t{}'.format(e))
+
 try:  # import the ladybug_rhino dependencies
+    from ladybug_rhino.fromgeometry import from_face3d_to_wireframe, \
+        from_polyface3d_to_wireframe, from_mesh3d_to_wireframe
     from ladybug_rhino.fromhoneybee import from_hb_objects_to_wireframe
+    from ladybug_rhino.config import current_tolerance
     from ladybug_rhino.grasshopper import all_required_inputs
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.visualize import lod_geometry
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+tolerance = current_tolerance()
+
 
 if all_required_inputs(ghenv.Component):
-    geo = from_hb_objects_to_wireframe(_hb_objs)
+    # get simplified geometry if the full-detail preview is over the budget
+    lod_geo = lod_geometry(_hb_objs, lod_budget_, tolerance) \
+        if lod_budget_ is not None else None
+
+    if lod_geo is not None:  # preview the simplified geometry
+        geo = []
+        for g in lod_geo:
+            if isinstance(g, Polyface3D):
+                geo.extend(from_polyface3d_to_wireframe(g))
+            elif isinstance(g, Mesh3D):
+                geo.extend(from_mesh3d_to_wireframe(g))
+            else:
+                geo.extend(from_face3d_to_wireframe(g))
+    else:
+        geo = from_hb_objects_to_wireframe(_hb_objs)
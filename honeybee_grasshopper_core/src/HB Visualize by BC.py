@@ -52,13 +52,18 @@ except ImportError as e:
     raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
 
 try:  # import the ladybug_rhino dependencies
-    from ladybug_rhino.fromgeometry import from_face3ds_to_colored_mesh, \
-        from_face3d_to_wireframe, from_mesh3ds_to_colored_mesh, \
-        from_mesh3d_to_wireframe
+    from ladybug_rhino.fromgeometry import from_face3d_to_wireframe, \
+        from_mesh3ds_to_colored_mesh, from_mesh3d_to_wireframe
     from ladybug_rhino.grasshopper import all_required_inputs
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.visualize import triangulated_mesh3d, \
+        punched_geometry
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
 try:  # import the honeybee-energy dependencies
     from honeybee.boundarycondition import Adiabatic
 except ImportError:  # honeybee-energy is not installed
@@ -67,7 +72,7 @@ except ImportError:  # honeybee-energy is not installed
 
 def add_shades(hb_obj):
     """Add assigned shade objects to the relevant list."""
-    _other.extend([shd.geometry for shd in hb_obj.shades])
+    _other.extend([(shd.identifier, shd.geometry) for shd in hb_obj.shades])
 
 
 def add_subface(ap, geo_list=None):
@@ -76,7 +81,7 @@ def add_subface(ap, geo_list=None):
     if geo_list is None:
         geo_list = _outdoors if isinstance(ap.boundary_condition, Outdoors) \
             else _surface
-    geo_list.append(ap.geometry)
+    geo_list.append((ap.identifier, ap.geometry))
 
 
 def add_face(face):
@@ -93,7 +98,7 @@ def add_face(face):
         geo_list = _adiabatic
     else:
         geo_list = _other
-    geo_list.append(face.punched_geometry)
+    geo_list.append((face.identifier, punched_geometry(face)))
     for ap in face.apertures:
         add_subface(ap, geo_list)
     for dr in face.doors:
@@ -107,6 +112,22 @@ def add_room(room):
         add_face(face)
 
 
+def colored_mesh(id_geos, color):
+    """Get a colored Rhino mesh from a list of object identifiers and Face3Ds.
+
+    Args:
+        id_geos: A list of tuples with an object identifier and a Face3D.
+        color: A ladybug Color for the mesh.
+
+    Returns:
+        A colored Rhino mesh or None if the list is empty.
+    """
+    if len(id_geos) == 0:
+        return None
+    meshes = [triangulated_mesh3d(obj_id, geo) for obj_id, geo in id_geos]
+    return from_mesh3ds_to_colored_mesh([m for m in meshes if m is not None], color)
+
+
 if all_required_inputs(ghenv.Component):
     # lists of rhino geometry to be filled with content
     _outdoors = []
@@ -123,7 +144,7 @@ if all_required_inputs(ghenv.Component):
             [add_face(face) for face in hb_obj.orphaned_faces]
             [add_subface(ap) for ap in hb_obj.orphaned_apertures]
             [add_subface(dr) for dr in hb_obj.orphaned_doors]
-            _other.extend([shd.geometry for shd in hb_obj.orphaned_shades])
+            _other.extend([(shd.identifier, shd.geometry) for shd in hb_obj.orphaned_shades])
             _shade_meshes.extend([shd.geometry for shd in hb_obj.shade_meshes])
         elif isinstance(hb_obj, Room):
             add_room(hb_obj)
@@ -134,26 +155,21 @@ if all_required_inputs(ghenv.Component):
         elif isinstance(hb_obj, Door):
             add_subface(hb_obj)
         elif isinstance(hb_obj, Shade):
-            _other.append(hb_obj.geometry)
+            _other.append((hb_obj.identifier, hb_obj.geometry))
         elif isinstance(hb_obj, ShadeMesh):
             _shade_meshes.append(hb_obj.geometry)
 
     # color all of the geometry with its respective surface type
     palette = Colorset.openstudio_palette()
-    outdoors = from_face3ds_to_colored_mesh(_outdoors, palette[9]) \
-        if len(_outdoors) != 0 else None
-    surface = from_face3ds_to_colored_mesh(_surface, palette[13]) \
-        if len(_surface) != 0 else None
-    ground = from_face3ds_to_colored_mesh(_ground, palette[2]) \
-        if len(_ground) != 0 else None
-    adiabatic = from_face3ds_to_colored_mesh(_adiabatic, palette[4]) \
-        if len(_adiabatic) != 0 else None
-    other = from_face3ds_to_colored_mesh(_other, palette[12]) \
-        if len(_other) != 0 else None
+    outdoors = colored_mesh(_outdoors, palette[9])
+    surface = colored_mesh(_surface, palette[13])
+    ground = colored_mesh(_ground, palette[2])
+    adiabatic = colored_mesh(_adiabatic, palette[4])
+    other = colored_mesh(_other, palette[12])
 
     # create the wire frame
     all_geo = _outdoors + _surface + _ground + _adiabatic + _other
-    wire_frame = [curve for face in all_geo for curve in from_face3d_to_wireframe(face)]
+    wire_frame = [curve for _, face in all_geo for curve in from_face3d_to_wireframe(face)]
 
     # process the shade meshes
     if len(_shade_meshes) != 0:
@@ -54,6 +54,11 @@ try:  # import the ladybug dependencies
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug:\n\t{}'.format(e))
 
+try:  # import the ladybug_geometry dependencies
+    from ladybug_geometry.geometry3d import Polyline3D, Mesh3D
+except ImportError as e:
+    raise ImportError('\nFailed to import ladybug_geometry:\n\t{}'.format(e))
+
 try:  # import the core honeybee dependencies
     from honeybee.model import Model
     from honeybee.room import Room
@@ -68,65 +73,92 @@ except ImportError as e:
     raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
 
 try:  # import the ladybug_rhino dependencies
-    from ladybug_rhino.fromgeometry import from_face3ds_to_colored_mesh, \
-        from_mesh3ds_to_colored_mesh, from_face3d_to_wireframe, \
-        from_mesh3d_to_wireframe
+    from ladybug_rhino.fromgeometry import from_mesh3ds_to_colored_mesh, \
+        from_linesegment3d, from_polyline3d
+    from ladybug_rhino.config import current_tolerance
     from ladybug_rhino.grasshopper import all_required_inputs
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+try:  # import the honeybee_grasshopper_core dependencies
+    from honeybee_grasshopper_core.visualize import triangulated_mesh3d, \
+        punched_geometry, welded_edges
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_core:\n\t{}'.format(e))
+
 try:  # import the honeybee-energy extension
     from honeybee.boundarycondition import Adiabatic
 except ImportError:  # honeybee-energy not installed
     Adiabatic = None  # don't worry about Aidabatic; Surface is the only interior bc
+tolerance = current_tolerance()
+
+
+def add_geometry(identifier, geo, buffer):
+    """Add the triangulated mesh of a Face3D to a buffer and its edges to the wireframe.
+
+    Args:
+        identifier: Text for the identifier of the object to which the Face3D belongs.
+        geo: A ladybug_geometry Face3D to be added.
+        buffer: A tuple with a list of vertices and a list of faces to which
+            the triangulated Face3D will be added.
+    """
+    tri_mesh = triangulated_mesh3d(identifier, geo)
+    if tri_mesh is not None:
+        verts, faces = buffer
+        st = len(verts)
+        verts.extend(tri_mesh.vertices)
+        faces.extend(tuple(st + i for i in f) for f in tri_mesh.faces)
+    wire_geos.append(geo)
 
 
 def add_shade(hb_obj):
-    """Add assigned shade objects to the relevant lists."""
-    _outdoor_shades.extend([shd.geometry for shd in hb_obj.outdoor_shades])
-    _indoor_shades.extend([shd.geometry for shd in hb_obj.indoor_shades])
+    """Add assigned shade objects to the relevant buffers."""
+    for shd in hb_obj.outdoor_shades:
+        add_geometry(shd.identifier, shd.geometry, _outdoor_shades)
+    for shd in hb_obj.indoor_shades:
+        add_geometry(shd.identifier, shd.geometry, _indoor_shades)
 
 
 def add_aperture(ap):
-    """Add an aperture to the relevant lists."""
+    """Add an aperture to the relevant buffers."""
     add_shade(ap)
     if isinstance(ap.boundary_condition, Surface):
-        _interior_apertures.append(ap.geometry)
+        add_geometry(ap.identifier, ap.geometry, _interior_apertures)
     else:
-        _apertures.append(ap.geometry)
+        add_geometry(ap.identifier, ap.geometry, _apertures)
 
 
 def add_door(dr):
-    """Add a door to the relevant lists."""
+    """Add a door to the relevant buffers."""
     add_shade(dr)
     if isinstance(dr.boundary_condition, Surface):
-        _interior_doors.append(dr.geometry)
+        add_geometry(dr.identifier, dr.geometry, _interior_doors)
     else:
-        _doors.append(dr.geometry)
+        add_geometry(dr.identifier, dr.geometry, _doors)
 
 
 def add_face(face):
-    """Add a Face to the relevant lists."""
+    """Add a Face to the relevant buffers."""
     add_shade(face)
     bc = face.boundary_condition
     type = face.type
     if isinstance(type, Wall):
         if isinstance(bc, (Surface, Adiabatic)):
-            _interior_walls.append(face.punched_geometry)
+            add_geometry(face.identifier, punched_geometry(face), _interior_walls)
         else:
-            _walls.append(face.punched_geometry)
+            add_geometry(face.identifier, punched_geometry(face), _walls)
     elif isinstance(type, RoofCeiling):
         if isinstance(bc, (Surface, Adiabatic)):
-            _ceilings.append(face.punched_geometry)
+            add_geometry(face.identifier, punched_geometry(face), _ceilings)
         else:
-            _roofs.append(face.punched_geometry)
+            add_geometry(face.identifier, punched_geometry(face), _roofs)
     elif isinstance(type, Floor):
         if isinstance(bc, (Surface, Adiabatic)):
-            _interior_floors.append(face.punched_geometry)
+            add_geometry(face.identifier, punched_geometry(face), _interior_floors)
         else:
-            _exterior_floors.append(face.punched_geometry)
+            add_geometry(face.identifier, punched_geometry(face), _exterior_floors)
     elif isinstance(type, AirBoundary):
-        _air_walls.append(face.punched_geometry)
+        add_geometry(face.identifier, punched_geometry(face), _air_walls)
 
     # add the apertures, doors, and shades
     for ap in face.apertures:
@@ -136,37 +168,55 @@ def add_face(face):
 
 
 def add_room(room):
-    """Add a Room to the relevant lists."""
+    """Add a Room to the relevant buffers."""
     add_shade(room)
     for face in room:
         add_face(face)
 
 
+def buffer_to_mesh(buffer, color):
+    """Get a colored Rhino mesh from a buffer of vertices and faces.
+
+    Args:
+        buffer: A tuple with a list of vertices and a list of faces.
+        color: A ladybug Color for the mesh.
+
+    Returns:
+        A colored Rhino mesh or None if the buffer has no faces.
+    """
+    verts, faces = buffer
+    if len(faces) == 0:
+        return None
+    return from_mesh3ds_to_colored_mesh([Mesh3D(verts, faces)], color)
+
+
 if all_required_inputs(ghenv.Component):
-    # lists of rhino geometry to be filled with content
-    _walls = []
-    _interior_walls = []
-    _roofs = []
-    _ceilings = []
-    _exterior_floors = []
-    _interior_floors = []
-    _air_walls = []
-    _apertures = []
-    _interior_apertures = []
-    _doors = []
-    _interior_doors = []
-    _outdoor_shades = []
-    _indoor_shades = []
+    # buffers of vertices and faces to be filled with content
+    _walls = ([], [])
+    _interior_walls = ([], [])
+    _roofs = ([], [])
+    _ceilings = ([], [])
+    _exterior_floors = ([], [])
+    _interior_floors = ([], [])
+    _air_walls = ([], [])
+    _apertures = ([], [])
+    _interior_apertures = ([], [])
+    _doors = ([], [])
+    _interior_doors = ([], [])
+    _outdoor_shades = ([], [])
+    _indoor_shades = ([], [])
     _shade_meshes = []
+    wire_geos = []
 
-    # loop through the objects and group them by type
+    # loop through the objects and add them to the buffers by type
     for hb_obj in _hb_objs:
         if isinstance(hb_obj, Model):
             [add_room(room) for room in hb_obj.rooms]
             [add_face(face) for face in hb_obj.orphaned_faces]
             [add_aperture(ap) for ap in hb_obj.orphaned_apertures]
             [add_door(dr) for dr in hb_obj.orphaned_doors]
-            _outdoor_shades.extend([shd.geometry for shd in hb_obj.orphaned_shades])
+            [add_geometry(shd.identifier, shd.geometry, _outdoor_shades)
+             for shd in hb_obj.orphaned_shades]
             _shade_meshes.extend([shd.geometry for shd in hb_obj.shade_meshes])
         elif isinstance(hb_obj, Room):
             add_room(hb_obj)
@@ -178,46 +228,27 @@ if all_required_inputs(ghenv.Component):
             add_door(hb_obj)
         elif isinstance(hb_obj, Shade):
             if hb_obj.is_indoor:
-                _indoor_shades.append(hb_obj.geometry)
+                add_geometry(hb_obj.identifier, hb_obj.geometry, _indoor_shades)
             else:
-                _outdoor_shades.append(hb_obj.geometry)
+                add_geometry(hb_obj.identifier, hb_obj.geometry, _outdoor_shades)
         elif isinstance(hb_obj, ShadeMesh):
             _shade_meshes.append(hb_obj.geometry)
 
     # color all of the geometry with its respective surface type
     palette = Colorset.openstudio_palette()
-    walls = from_face3ds_to_colored_mesh(_walls, palette[0]) \
-        if len(_walls) != 0 else None
-    interior_walls = from_face3ds_to_colored_mesh(_interior_walls, palette[1]) \
-        if len(_interior_walls) != 0 else None
-    roofs = from_face3ds_to_colored_mesh(_roofs, palette[3]) \
-        if len(_roofs) != 0 else None
-    ceilings = from_face3ds_to_colored_mesh(_ceilings, palette[4]) \
-        if len(_ceilings) != 0 else None
-    exterior_floors = from_face3ds_to_colored_mesh(_exterior_floors, palette[6]) \
-        if len(_exterior_floors) != 0 else None
-    interior_floors = from_face3ds_to_colored_mesh(_interior_floors, palette[7]) \
-        if len(_interior_floors) != 0 else None
-    air_walls = from_face3ds_to_colored_mesh(_air_walls, palette[12]) \
-        if len(_air_walls) != 0 else None
-    apertures = from_face3ds_to_colored_mesh(_apertures, palette[9]) \
-        if len(_apertures) != 0 else None
-    interior_apertures = from_face3ds_to_colored_mesh(_interior_apertures, palette[9]) \
-        if len(_interior_apertures) != 0 else None
-    doors = from_face3ds_to_colored_mesh(_doors, palette[10]) \
-        if len(_doors) != 0 else None
-    interior_doors = from_face3ds_to_colored_mesh(_interior_doors, palette[10]) \
-        if len(_interior_doors) != 0 else None
-    outdoor_shades = from_face3ds_to_colored_mesh(_outdoor_shades, palette[11]) \
-        if len(_outdoor_shades) != 0 else None
-    indoor_shades = from_face3ds_to_colored_mesh(_indoor_shades, palette[11]) \
-        if len(_indoor_shades) != 0 else None
-
-    # create the wire frame
-    all_geo = _walls + _interior_walls + _roofs + _ceilings + _exterior_floors + \
-        _interior_floors + _air_walls + _apertures + _interior_apertures + _doors + \
-        _interior_doors + _outdoor_shades + _indoor_shades
-    wire_frame = [curve for face in all_geo for curve in from_face3d_to_wireframe(face)]
+    walls = buffer_to_mesh(_walls, palette[0])
+    interior_walls = buffer_to_mesh(_interior_walls, palette[1])
+    roofs = buffer_to_mesh(_roofs, palette[3])
+    ceilings = buffer_to_mesh(_ceilings, palette[4])
+    exterior_floors = buffer_to_mesh(_exterior_floors, palette[6])
+    interior_floors = buffer_to_mesh(_interior_floors, palette[7])
+    air_walls = buffer_to_mesh(_air_walls, palette[12])
+    apertures = buffer_to_mesh(_apertures, palette[9])
+    interior_apertures = buffer_to_mesh(_interior_apertures, palette[9])
+    doors = buffer_to_mesh(_doors, palette[10])
+    interior_doors = buffer_to_mesh(_interior_doors, palette[10])
+    outdoor_shades = buffer_to_mesh(_outdoor_shades, palette[11])
+    indoor_shades = buffer_to_mesh(_indoor_shades, palette[11])
 
     # process the shade meshes
     if len(_shade_meshes) != 0:
@@ -226,5 +257,8 @@ if all_required_inputs(ghenv.Component):
         else:
             outdoor_shades = [outdoor_shades]
         outdoor_shades.append(from_mesh3ds_to_colored_mesh(_shade_meshes, palette[11]))
-        for mesh in _shade_meshes:
-            wire_frame.extend(from_mesh3d_to_wireframe(mesh))
+
+    # weld the edges of all geometry into a wireframe without duplicated edges
+    wire_frame = [from_polyline3d(pl) if isinstance(pl, Polyline3D) else
+                  from_linesegment3d(pl) for pl in
+                  welded_edges(wire_geos + _shade_meshes, tolerance)]
\ No newline at end of file
@@ -0,0 +1,415 @@
+"""Functions shared by the components that visualize honeybee objects.
+
+The caches in this module are shared by all of the components that import it
+so an unchanged model only needs to be processed once across recomputes and
+components. Each cache only keeps a fixed number of the most recently used
+results.
+"""
+import math
+from collections import OrderedDict
+
+from ladybug_geometry.geometry3d import Plane, LineSegment3D, Polyline3D, \
+    Face3D, Polyface3D, Mesh3D
+
+from honeybee.model import Model
+from honeybee.room import Room
+from honeybee.face import Face
+from honeybee.aperture import Aperture
+from honeybee.door import Door
+from honeybee.facetype import Floor
+
+from ladybug_rhino.grasshopper import run_function_in_parallel
+
+TRI_CACHE_SIZE = 50000
+_tri_cache = OrderedDict()  # triangulated Mesh3Ds keyed by identifier and geometry
+PUNCH_CACHE_SIZE = 50000
+_punch_cache = OrderedDict()  # punched Face3Ds keyed by Face and sub-face geometry
+POINT_CACHE_SIZE = 50000
+_point_cache = OrderedDict()  # points on Face3Ds keyed by geometry and tolerance
+
+
+def triangulated_mesh3d(identifier, geo):
+    """Get the triangulated Mesh3D of a Face3D using the shared triangulation cache.
+
+    The cache is keyed by the identifier of the object along with the Face3D
+    itself so that a cached mesh is only used when the geometry is equal, rather
+    than when two different Face3Ds happen to share a hash. Only the
+    TRI_CACHE_SIZE most recently used meshes are kept.
+
+    Args:
+        identifier: Text for the identifier of the object to which the Face3D
+            belongs or None if the Face3D does not belong to a single object.
+        geo: A ladybug_geometry Face3D to be triangulated.
+
+    Returns:
+        A triangulated Mesh3D or None if the Face3D could not be triangulated.
+    """
+    key = (identifier, geo)
+    try:
+        mesh = _tri_cache.pop(key)  # pop it to put it back as the most recent
+    except KeyError:  # the geometry has not been triangulated yet
+        try:
+            mesh = geo.triangulated_mesh3d
+        except Exception:
+            return None  # failed to triangulate the Face3D
+        if len(_tri_cache) >= TRI_CACHE_SIZE:
+            _tri_cache.popitem(last=False)  # remove the least recently used mesh
+    _tri_cache[key] = mesh
+    return mesh
+
+
+def punched_geometry(face):
+    """Get the punched geometry of a Face using the shared punched geometry cache.
+
+    The cache is keyed by the identifier of the Face along with its Face3D and
+    the Face3Ds of its Apertures and Doors. So the holes only need to be punched
+    again when the geometry is edited, even if the Face has been duplicated or
+    rebuilt upstream, and a cached result is only used when the geometry is
+    equal rather than when it happens to share a hash. Only the PUNCH_CACHE_SIZE
+    most recently used geometries are kept.
+
+    Args:
+        face: A honeybee Face for which the punched geometry will be returned.
+    """
+    sub_faces = face.apertures + face.doors
+    if len(sub_faces) == 0:
+        return face.geometry
+    key = (face.identifier, face.geometry, tuple(sf.geometry for sf in sub_faces))
+    try:
+        p_geo = _punch_cache.pop(key)  # pop it to put it back as the most recent
+    except KeyError:  # the holes have not been punched yet
+        p_geo = face.punched_geometry
+        if len(_punch_cache) >= PUNCH_CACHE_SIZE:
+            _punch_cache.popitem(last=False)  # remove the least recently used geometry
+    _punch_cache[key] = p_geo
+    return p_geo
+
+
+def points_on_faces(geos, tolerance, cpu_count):
+    """Get points that lie on a list of Face3Ds using the shared point cache.
+
+    The center is used for convex Face3Ds while the pole of inaccessibility
+    is computed in parallel for all non-convex Face3Ds that are not yet in
+    the cache. The cache is keyed by each Face3D along with the tolerance so
+    that a cached point is only used when the geometry is equal rather than
+    when it happens to share a hash. Only the POINT_CACHE_SIZE most recently
+    used points are kept.
+
+    Args:
+        geos: A list of ladybug_geometry Face3D.
+        tolerance: The tolerance used to compute the poles of inaccessibility.
+        cpu_count: An integer for the number of CPUs used to compute the
+            poles of inaccessibility.
+
+    Returns:
+        A list of Point3D that lie on each of the input Face3Ds.
+    """
+    # get all of the points in the cache and the centers of convex geometry
+    keys = [(geo, tolerance) for geo in geos]
+    pts, poles = [None] * len(geos), []
+    for i, (key, geo) in enumerate(zip(keys, geos)):
+        try:
+            pts[i] = _point_cache[key]
+        except KeyError:  # the point has not been computed yet
+            if geo.is_convex:
+                pts[i] = geo.center
+            else:
+                poles.append(i)
+
+    # compute the poles of inaccessibility in parallel
+    def compute_pole(count):
+        i = poles[count]
+        pts[i] = geos[i].pole_of_inaccessibility(tolerance)
+
+    if len(poles) != 0:
+        run_function_in_parallel(compute_pole, len(poles), cpu_count)
+
+    # put all of the points back in the cache as the most recently used
+    for key, pt in zip(keys, pts):
+        _point_cache.pop(key, None)
+        _point_cache[key] = pt
+    while len(_point_cache) > POINT_CACHE_SIZE:
+        _point_cache.popitem(last=False)  # remove the least recently used point
+    return pts
+
+
+def triangle_count(geo):
+    """Estimate the number of triangles in the preview of a ladybug geometry."""
+    if isinstance(geo, Face3D):
+        return len(geo.vertices) - 2
+    elif isinstance(geo, Polyface3D):
+        return sum(len(face.vertices) - 2 for face in geo.faces)
+    return len(geo.faces)  # Mesh3D
+
+
+def face_triangle_count(face):
+    """Estimate the number of triangles in the preview of a Face with its holes punched.
+
+    The estimate uses the vertices of the Face and its sub-faces so that the
+    holes do not have to be punched. Each hole adds its own vertices to the
+    punched geometry along with two vertices to bridge it to the boundary.
+    """
+    return triangle_count(face.geometry) + \
+        sum(len(sf.geometry.vertices) + 2 for sf in face.apertures + face.doors)
+
+
+def room_box(room):
+    """Get a Polyface3D for the bounding box around a Room."""
+    r_min, r_max = room.min, room.max
+    return Polyface3D.from_box(r_max.x - r_min.x, r_max.y - r_min.y,
+                               r_max.z - r_min.z, Plane(o=r_min))
+
+
+def room_outline(room, tolerance):
+    """Get a Polyface3D extruded from the floor of a Room.
+
+    The bounding box around the Room will be returned if the Room does not
+    have a single horizontal floor.
+    """
+    floors = [face.geometry for face in room.faces if isinstance(face.type, Floor)]
+    height = room.max.z - room.min.z
+    if len(floors) == 1 and floors[0].is_horizontal(tolerance) and height > tolerance:
+        return Polyface3D.from_offset_face(floors[0].flip(), height)
+    return room_box(room)
+
+
+def child_objects(hb_obj):
+    """Get the Apertures, Doors and Shades assigned to an object."""
+    objs = list(hb_obj.shades)
+    if isinstance(hb_obj, Face):
+        for sub_f in hb_obj.apertures + hb_obj.doors:
+            objs.append(sub_f)
+            objs.extend(sub_f.shades)
+    return objs
+
+
+def lod_geometry(hb_objs, budget, tolerance, sub_faces=True):
+    """Get simplified geometry to preview Honeybee objects within a triangle budget.
+
+    Rooms are kept in full detail if they fit within the budget. Otherwise,
+    they are collapsed to an extrusion of their floor and then to their
+    bounding box. All other geometry (including sub-faces and shades) is then
+    added from the largest to the smallest until the budget is used up, which
+    drops the objects below a size threshold. The triangles are estimated
+    without punching the holes of any Faces and the holes are only punched
+    for the Faces that end up in the preview.
+
+    Args:
+        hb_objs: A list of Honeybee objects to be previewed.
+        budget: An integer for the target number of triangles in the preview.
+        tolerance: The maximum difference between values at which point vertices
+            are considered to be the same.
+        sub_faces: Boolean to note whether the Apertures, Doors and Shades
+            assigned to other objects should be included. (Default: True).
+
+    Returns:
+        A list of ladybug_geometry Face3D, Polyface3D and Mesh3D or None if
+        all of the geometry fits within the budget in full detail.
+    """
+    # gather the Rooms and all of the other objects
+    rooms, others = [], []
+    for hb_obj in hb_objs:
+        if isinstance(hb_obj, Model):
+            rooms.extend(hb_obj.rooms)
+            objs = hb_obj.orphaned_faces + hb_obj.orphaned_apertures + \
+                hb_obj.orphaned_doors + hb_obj.orphaned_shades + hb_obj.shade_meshes
+        elif isinstance(hb_obj, Room):
+            rooms.append(hb_obj)
+            objs = ()
+        else:
+            objs = (hb_obj,)
+        for obj in objs:
+            others.append(obj)
+            if sub_faces and isinstance(obj, (Face, Aperture, Door)):
+                others.extend(child_objects(obj))
+    if sub_faces:
+        for room in rooms:
+            others.extend(room.shades)
+            for face in room.faces:
+                others.extend(child_objects(face))
+
+    # estimate the number of triangles in the full-detail preview
+    if sub_faces:
+        room_count = sum(face_triangle_count(face)
+                         for room in rooms for face in room.faces)
+    else:
+        room_count = sum(triangle_count(room.geometry) for room in rooms)
+    other_counts = [face_triangle_count(obj) if isinstance(obj, Face)
+                    else triangle_count(obj.geometry) for obj in others]
+    if room_count + sum(other_counts) <= budget:
+        return None  # everything can be previewed in full detail
+
+    # collapse the Rooms to the first level of detail that fits the budget
+    if room_count <= budget:  # the Rooms can be previewed in full detail
+        lod_geo = [punched_geometry(face) for room in rooms for face in room.faces] \
+            if sub_faces else [room.geometry for room in rooms]
+    else:
+        lod_geo = [room_outline(room, tolerance) for room in rooms]
+        room_count = sum(triangle_count(geo) for geo in lod_geo)
+        if room_count > budget:
+            lod_geo = [room_box(room) for room in rooms]
+            room_count = sum(triangle_count(geo) for geo in lod_geo)
+
+    # add the other geometry from largest to smallest within the budget
+    other_areas = []
+    for obj in others:
+        area = obj.geometry.area
+        if isinstance(obj, Face):  # subtract the holes for the sub-faces
+            area -= sum(sf.geometry.area for sf in obj.apertures + obj.doors)
+        other_areas.append(area)
+    remaining = budget - room_count
+    for i in sorted(range(len(others)), key=lambda i: other_areas[i], reverse=True):
+        remaining -= other_counts[i]
+        if remaining < 0:
+            break
+        obj = others[i]
+        lod_geo.append(punched_geometry(obj) if isinstance(obj, Face) else obj.geometry)
+    return lod_geo
+
+
+def _edge_loops(geos):
+    """Get the closed loops of vertices around the faces of ladybug geometries."""
+    loops = []
+    for geo in geos:
+        if isinstance(geo, Mesh3D):
+            verts = geo.vertices
+            loops.extend([verts[i] for i in f] for f in geo.faces)
+        else:
+            faces = geo.faces if isinstance(geo, Polyface3D) else (geo,)
+            for face in faces:
+                loops.append(face.boundary)
+                if face.has_holes:
+                    loops.extend(face.holes)
+    return loops
+
+
+def unique_edges(geos, tolerance):
+    """Get the unique edges of ladybug geometries with their vertices welded.
+
+    Each vertex is welded to the first vertex within the tolerance of it,
+    which is found by searching a grid of cells that are the size of the
+    tolerance. So vertices are welded even when they lie on either side of
+    a cell boundary and edges that are shared between adjacent faces are
+    only counted once.
+
+    Args:
+        geos: A list of ladybug_geometry Face3D, Polyface3D and Mesh3D.
+        tolerance: The maximum distance between vertices at which point
+            they are considered to be the same.
+
+    Returns:
+        A tuple with two items.
+
+        -   points: A list of the welded Point3Ds.
+
+        -   edges: A list of unique edges as tuples of two point indices
+            where the first index is always the smaller one.
+    """
+    points, grid, edges, edge_set = [], {}, [], set()
+    for loop in _edge_loops(geos):
+        ids = []
+        for pt in loop:
+            cx, cy, cz = int(math.floor(pt.x / tolerance)), \
+                int(math.floor(pt.y / tolerance)), int(math.floor(pt.z / tolerance))
+            for key in ((cx + i, cy + j, cz + k) for i in (0, -1, 1)
+                        for j in (0, -1, 1) for k in (0, -1, 1)):
+                match = next((p_i for p_i in grid.get(key, ())
+                              if points[p_i].is_equivalent(pt, tolerance)), None)
+                if match is not None:
+                    ids.append(match)
+                    break
+            else:  # the first vertex at this location
+                grid.setdefault((cx, cy, cz), []).append(len(points))
+                ids.append(len(points))
+                points.append(pt)
+        for i_1, i_2 in zip(ids, ids[1:] + ids[:1]):
+            edge = (i_1, i_2) if i_1 < i_2 else (i_2, i_1)
+            if i_1 != i_2 and edge not in edge_set:
+                edge_set.add(edge)
+                edges.append(edge)
+    return points, edges
+
+
+def _edge_trails(point_count, edges):
+    """Get the fewest chains of point indices that cover a list of edges once each.
+
+    Every vertex where an odd number of edges meet is joined to a virtual vertex
+    so that all vertices have an even number of edges. The Euler circuit through
+    all of the edges is then split wherever it passes through the virtual vertex,
+    which gives the smallest possible number of chains (one for every two odd
+    vertices plus one closed chain for each part of the edges without them).
+    """
+    # join each vertex with an odd number of edges to a virtual vertex
+    virtual = point_count
+    all_edges, adjacent = list(edges), [[] for _ in range(point_count + 1)]
+    for e_i, (i_1, i_2) in enumerate(edges):
+        adjacent[i_1].append(e_i)
+        adjacent[i_2].append(e_i)
+    for p_i in range(point_count):
+        if len(adjacent[p_i]) % 2 == 1:
+            adjacent[p_i].append(len(all_edges))
+            adjacent[virtual].append(len(all_edges))
+            all_edges.append((p_i, virtual))
+
+    # walk the Euler circuit of each part of the edges and split it into chains
+    used, next_edge, trails = [False] * len(all_edges), [0] * (point_count + 1), []
+    for start in [virtual] + list(range(point_count)):
+        stack, circuit = [start], []
+        while len(stack) != 0:
+            p_i = stack[-1]
+            p_edges = adjacent[p_i]
+            while next_edge[p_i] < len(p_edges) and used[p_edges[next_edge[p_i]]]:
+                next_edge[p_i] += 1
+            if next_edge[p_i] == len(p_edges):  # all edges of the vertex are used
+                circuit.append(stack.pop())
+            else:
+                e_i = p_edges[next_edge[p_i]]
+                used[e_i] = True
+                stack.append(sum(all_edges[e_i]) - p_i)
+        trail = []
+        for p_i in circuit:
+            if p_i == virtual:
+                if len(trail) > 1:
+                    trails.append(trail)
+                trail = []
+            else:
+                trail.append(p_i)
+        if len(trail) > 1:
+            trails.append(trail)
+    return trails
+
+
+def welded_edges(geos, tolerance, merge_collinear=False):
+    """Get Polyline3Ds that cover the unique edges of ladybug geometries.
+
+    Edges that are shared between adjacent faces are only output once and
+    the edges that meet at a vertex are joined into as few polylines as
+    possible, including at corners. So a box is previewed with four curves
+    instead of the six outlines of its faces.
+
+    Args:
+        geos: A list of ladybug_geometry Face3D, Polyface3D and Mesh3D.
+        tolerance: The maximum distance between vertices at which point
+            they are considered to be the same.
+        merge_collinear: Boolean to note whether the vertices of the polylines
+            that lie on a straight line between their neighbors should be
+            removed. (Default: False).
+
+    Returns:
+        A list of Polyline3D along with LineSegment3D for any edges that could
+        not be joined to others, which together cover each unique edge once.
+    """
+    points, edges = unique_edges(geos, tolerance)
+    lines = []
+    for trail in _edge_trails(len(points), edges):
+        verts = [points[p_i] for p_i in trail]
+        if merge_collinear:
+            merged = [verts[0]]
+            for pt, next_pt in zip(verts[1:-1], verts[2:]):
+                seg = LineSegment3D.from_end_points(merged[-1], next_pt)
+                if seg.distance_to_point(pt) > tolerance:
+                    merged.append(pt)
+            verts = merged + [verts[-1]]
+        lines.append(Polyline3D(verts) if len(verts) > 2
+                     else LineSegment3D.from_end_points(*verts))
+    return lines